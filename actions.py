@@ -4,17 +4,113 @@ Implements menu actions like copy, paste, and quit.
 """
 
 import sys
+import time
+import logging
+import operator
+import functools
+import itertools
 import subprocess
+from collections import defaultdict
 import objc
 import Cocoa
+import Quartz
+import ApplicationServices
 from PyObjCTools import AppHelper
 
 
+log = logging.getLogger("handy.actions")
+
+# Mac virtual key codes for the keys sent by menu actions
+KEY_CODES = {
+    'a': 0,
+    's': 1,
+    'd': 2,
+    'f': 3,
+    'z': 6,
+    'c': 8,
+    'v': 9,
+    '\t': 48,
+    ' ': 49,
+    '`': 50,
+    '\x1b': 53,
+}
+
+# CGEvent flag masks for the modifier names used by menu actions
+MODIFIER_FLAGS = {
+    'command': Quartz.kCGEventFlagMaskCommand,
+    'shift': Quartz.kCGEventFlagMaskShift,
+    'option': Quartz.kCGEventFlagMaskAlternate,
+    'control': Quartz.kCGEventFlagMaskControl,
+}
+
+# Combined flag mask for every combination of modifier names,
+# so sending a keystroke is a single lookup
+MODIFIER_MASKS = {
+    frozenset(combo): functools.reduce(operator.or_, (MODIFIER_FLAGS[mod] for mod in combo), 0)
+    for count in range(len(MODIFIER_FLAGS) + 1)
+    for combo in itertools.combinations(MODIFIER_FLAGS, count)
+}
+
+# AppleScript "using {...}" clause for the same modifier combinations
+MODIFIER_CLAUSES = {
+    combo: ' using {' + ', '.join(f'{mod} down' for mod in sorted(combo)) + '}' if combo else ''
+    for combo in MODIFIER_MASKS
+}
+
+# Menu actions that send a single keystroke:
+# selector name -> (description, key_name, modifiers, global)
+# 'global' marks shortcuts handled by another app rather than the previous app
+KEYSTROKE_ACTIONS = {
+    'performPaste_': ('Paste (Cmd+V)', 'v', ['command'], False),
+    'performSave_': ('Save (Cmd+S)', 's', ['command'], False),
+    'performAlfred_': ('Alfred (Option+Space)', ' ', ['option'], True),
+    'performSwitchWindow_': ('Switch Window (Cmd+`)', '`', ['command'], True),
+    'performEscape_': ('Escape', '\x1b', [], False),
+    'performTab_': ('Tab', '\t', [], False),
+    'performFind_': ('Find (Cmd+F)', 'f', ['command'], False),
+    'performUndo_': ('Undo (Cmd+Z)', 'z', ['command'], False),
+    'performDeselect_': ('Deselect (Cmd+D)', 'd', ['command'], False),
+    'performSelectAll_': ('Select All (Cmd+A)', 'a', ['command'], False),
+    'performPastebot_': ('Pastebot (Cmd+Shift+V)', 'v', ['command', 'shift'], True),
+    'performPastePlain_': ('Paste Without Formatting (Cmd+Option+Shift+V)', 'v', ['command', 'shift', 'option'], False),
+    'performPixelSnap_': ('PixelSnap (Cmd+Option+S)', 's', ['command', 'option'], True),
+    'performColorSlurp_': ('ColorSlurp (Cmd+Option+Control+C)', 'c', ['command', 'option', 'control'], True),
+}
+
+# Start dictation from the frontmost app's Edit menu
+DICTATION_SCRIPT = '''
+tell application "System Events"
+    tell (first application process whose frontmost is true)
+        click menu item "Start Dictation" of menu "Edit" of menu bar 1
+    end tell
+end tell
+'''
+
+# Key code for the fn key, pressed twice as a dictation fallback
+FN_KEY_CODE = 63
+
+# Private run loop mode for waiting on Accessibility notifications. Only the
+# observer's source is added to it, so queued main-thread work (showing the
+# menu, hover updates, triggering an item) can't run in the middle of an action.
+AX_WAIT_RUN_LOOP_MODE = 'HandyAXWaitMode'
+
+
 class Actions(Cocoa.NSObject):
     """Handles menu actions using PyObjC."""
 
-    # Delay in seconds before sending keystrokes (adjust this value to tune responsiveness)
-    KEYSTROKE_DELAY = 0.01
+    # Maximum time in seconds to wait for the previous app to become active
+    ACTIVATION_TIMEOUT = 0.05
+
+    # Maximum time in seconds to wait for a selection change after Cmd+A
+    SELECTION_TIMEOUT = 0.05
+
+    # Extra settle time after activation, learned per app from keystroke
+    # outcomes: grows when an AppleScript keystroke fails or a HID keystroke
+    # is posted before the app reported activation, decays on success.
+    # Only read and written on the main thread.
+    SETTLE_DELAY_STEP = 0.01
+    SETTLE_DELAY_DECAY = 0.001
+    SETTLE_DELAY_MAX = 0.15
 
     def init(self):
         """Initialize the actions handler."""
@@ -23,8 +119,72 @@ class Actions(Cocoa.NSObject):
             return None
         self.previous_app = None
         self.captured_text = None
+        self._settle_delays = defaultdict(float)
+
+        # Edit > Select All AXUIElements, keyed by app bundle id
+        self._select_all_items = {}
+        self._accessibility_trusted = False
+
+        # One event source for every posted key. Zero suppression so rapid
+        # repeats (e.g. fn fn for Dictation) aren't swallowed.
+        self._event_source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+        Quartz.CGEventSourceSetLocalEventsSuppressionInterval(self._event_source, 0.0)
+
+        # Serial queue that runs every AppleScript so slow Apple Events never
+        # block the main thread. NSAppleScript isn't safe to use concurrently,
+        # so compiled scripts are only touched by operations on this queue.
+        self._script_queue = Cocoa.NSOperationQueue.alloc().init()
+        self._script_queue.setMaxConcurrentOperationCount_(1)
+
+        # Compiled NSAppleScript objects keyed by source
+        self._scripts = {}
+        self._script_queue.addOperationWithBlock_(lambda: self.compile_apple_script(DICTATION_SCRIPT))
+
+        # App launcher caches: app path -> bundle id, bundle id -> running app.
+        # The running-app map is kept current by workspace notifications.
+        workspace = Cocoa.NSWorkspace.sharedWorkspace()
+        self._bundle_ids_by_path = {}
+        self._running_apps_by_bundle_id = {}
+        for app in workspace.runningApplications():
+            bundle_id = app.bundleIdentifier()
+            if bundle_id:
+                self._running_apps_by_bundle_id[bundle_id] = app
+
+        notification_center = workspace.notificationCenter()
+        notification_center.addObserver_selector_name_object_(
+            self,
+            'workspaceDidLaunchApplication:',
+            Cocoa.NSWorkspaceDidLaunchApplicationNotification,
+            None
+        )
+        notification_center.addObserver_selector_name_object_(
+            self,
+            'workspaceDidTerminateApplication:',
+            Cocoa.NSWorkspaceDidTerminateApplicationNotification,
+            None
+        )
         return self
 
+    def workspaceDidLaunchApplication_(self, notification):
+        """Record a newly launched app in the running-app cache."""
+        app = notification.userInfo()[Cocoa.NSWorkspaceApplicationKey]
+        bundle_id = app.bundleIdentifier()
+        if bundle_id:
+            self._running_apps_by_bundle_id[bundle_id] = app
+
+    def workspaceDidTerminateApplication_(self, notification):
+        """Drop a terminated app from the running-app cache."""
+        app = notification.userInfo()[Cocoa.NSWorkspaceApplicationKey]
+        bundle_id = app.bundleIdentifier()
+        cached = self._running_apps_by_bundle_id.get(bundle_id)
+        if cached is not None and cached.processIdentifier() == app.processIdentifier():
+            del self._running_apps_by_bundle_id[bundle_id]
+
+    def teardown(self):
+        """Stop observing workspace notifications and drop cached scripts."""
+        Cocoa.NSWorkspace.sharedWorkspace().notificationCenter().removeObserver_(self)
+        self._script_queue.addOperationWithBlock_(lambda: self._scripts.clear())
+
     def set_captured_text(self, text):
         """Store captured text for use by Copy action."""
         self.captured_text = text
@@ -33,192 +193,191 @@ class Actions(Cocoa.NSObject):
         """Store the previously active application."""
         self.previous_app = app
 
-    def sendKeystroke_(self, key_name):
+    def compile_apple_script(self, source):
         """
-        Send a keystroke using AppleScript to the previously active app.
+        Compile an AppleScript once and cache it for reuse.
 
         Args:
-            key_name: The key name ('c' for copy, 'v' for paste)
-        """
-        # Reactivate the previous app first
-        if self.previous_app:
-            app_name = self.previous_app.localizedName()
-            print(f"Reactivating: {app_name}")
-            self.previous_app.activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps)
+            source: AppleScript source code
 
-        # Use AppleScript with proper error handling
-        # The delay helps ensure the app is reactivated
-        script = f'''
-        delay {self.KEYSTROKE_DELAY}
-        tell application "System Events"
-            keystroke "{key_name}" using command down
-        end tell
-        '''
+        Returns:
+            Compiled NSAppleScript object
+        """
+        script = self._scripts.get(source)
+        if script is None:
+            script = Cocoa.NSAppleScript.alloc().initWithSource_(source)
+            script.compileAndReturnError_(None)
+            self._scripts[source] = script
+        return script
 
-        try:
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
+    def run_apple_script(self, source):
+        """
+        Run an AppleScript in-process using the cached compiled script.
 
-            if result.returncode == 0:
-                print(f"Keystroke '{key_name}' sent successfully")
-            else:
-                print(f"AppleScript error: {result.stderr.strip()}")
-
-                # Check if it's a permission error
-                if "not allowed" in result.stderr or "1002" in result.stderr:
-                    print("\n⚠️  PERMISSION NEEDED:")
-                    print("   Terminal/Warp needs permission to control your computer.")
-                    print("   Run this command to open System Settings:")
-                    print("   open 'x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility'")
-                    print("   Then manually add Warp or Terminal and enable it.\n")
-
-        except subprocess.TimeoutExpired:
-            print("Keystroke timed out")
-        except Exception as e:
-            print(f"Error sending keystroke: {e}")
+        Args:
+            source: AppleScript source code
 
-    def activateApp_(self, app_path_obj):
+        Returns:
+            None on success, or an error message string on failure
         """
-        Activate (bring to front) the specified application.
+        script = self.compile_apple_script(source)
+        result, error = script.executeAndReturnError_(None)
+        if error is None:
+            return None
+        message = error.get(Cocoa.NSAppleScriptErrorMessage, 'Unknown error')
+        number = error.get(Cocoa.NSAppleScriptErrorNumber)
+        return f"{message} ({number})" if number is not None else message
 
-        Args:
-            app_path_obj: Dictionary with 'path' key containing app path
+    def reactivate_previous_app(self):
         """
-        app_path = app_path_obj['path'] if isinstance(app_path_obj, dict) else app_path_obj
+        Bring the previously active app back to the front.
+        Returns as soon as the app posts its activated notification, or after
+        ACTIVATION_TIMEOUT seconds.
 
-        workspace = Cocoa.NSWorkspace.sharedWorkspace()
+        Returns:
+            False if the app didn't report activation within the timeout
+        """
+        if not self.previous_app or self.previous_app.isActive():
+            return True
 
-        # Try to find the running app by bundle identifier or path
-        bundle_url = Cocoa.NSURL.fileURLWithPath_(app_path)
-        bundle = Cocoa.NSBundle.bundleWithURL_(bundle_url)
+        app_name = self.previous_app.localizedName()
+        log.debug(f"Reactivating: {app_name}")
+        activated = self.wait_for_ax_notification(
+            ApplicationServices.kAXApplicationActivatedNotification,
+            lambda: self.previous_app.activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps),
+            self.ACTIVATION_TIMEOUT
+        )
+        self.settle_previous_app()
+        return activated
 
-        if bundle:
-            bundle_id = bundle.bundleIdentifier()
-            running_apps = workspace.runningApplications()
-
-            # Look for the app in running applications
-            for app in running_apps:
-                if app.bundleIdentifier() == bundle_id:
-                    print(f"Activating {app.localizedName()}")
-                    app.activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps)
-                    return
-
-            # App not running, launch it
-            print(f"Launching {app_path}")
-            workspace.openURL_(bundle_url)
-        else:
-            print(f"Could not find bundle for {app_path}")
+    def settle_previous_app(self):
+        """Give an app known to be slow to accept input its learned settle time."""
+        settle_delay = self._settle_delays[self.previous_app.bundleIdentifier()]
+        if settle_delay > 0:
+            time.sleep(settle_delay)
 
-    def performCopy_(self, sender):
+    def record_keystroke_result(self, bundle_id, succeeded):
         """
-        Perform copy action - use captured text if available, otherwise Cmd+C.
+        Adapt the settle delay for an app after a keystroke. Called on the
+        main thread.
 
         Args:
-            sender: The menu item that triggered this action
+            bundle_id: Bundle identifier of the target app
+            succeeded: Whether the app accepted the keystroke
         """
-        if self.captured_text:
-            print(f"Copying captured text to clipboard: {self.captured_text[:50]}...")
-            import Cocoa
-            pasteboard = Cocoa.NSPasteboard.generalPasteboard()
-            pasteboard.clearContents()
-            pasteboard.setString_forType_(self.captured_text, Cocoa.NSPasteboardTypeString)
+        delay = self._settle_delays[bundle_id]
+        if succeeded:
+            self._settle_delays[bundle_id] = max(0.0, delay - self.SETTLE_DELAY_DECAY)
         else:
-            print("Executing Copy (Cmd+C)")
-            self.sendKeystroke_('c')
+            self._settle_delays[bundle_id] = min(self.SETTLE_DELAY_MAX, delay + self.SETTLE_DELAY_STEP)
 
-    def performPaste_(self, sender):
+    def sendKeystroke_(self, key_name):
         """
-        Perform paste action (Cmd+V).
+        Send a Command+key keystroke to the previously active app.
 
         Args:
-            sender: The menu item that triggered this action
+            key_name: The key name ('c' for copy, 'v' for paste)
         """
-        print("Executing Paste (Cmd+V)")
-        self.sendKeystroke_('v')
+        self.sendKeystrokeWithModifiers_({'key_name': key_name, 'modifiers': ['command']})
 
-    def performSave_(self, sender):
+    def activateApp_(self, app_path_obj):
         """
-        Perform save action (Cmd+S).
+        Activate (bring to front) the specified application.
 
         Args:
-            sender: The menu item that triggered this action
+            app_path_obj: Dictionary with 'path' key containing app path
         """
-        print("Executing Save (Cmd+S)")
-        self.sendKeystroke_('s')
+        app_path = app_path_obj['path'] if isinstance(app_path_obj, dict) else app_path_obj
 
-    def performAlfred_(self, sender):
-        """
-        Perform Alfred action (Option+Space).
+        bundle_url = Cocoa.NSURL.fileURLWithPath_(app_path)
 
-        Args:
-            sender: The menu item that triggered this action
-        """
-        print("Executing Alfred (Option+Space)")
-        self.sendKeystrokeWithModifiers_({'key_name': ' ', 'modifiers': ['option']})
+        # Resolve the bundle identifier once per path
+        bundle_id = self._bundle_ids_by_path.get(app_path)
+        if bundle_id is None:
+            bundle = Cocoa.NSBundle.bundleWithURL_(bundle_url)
+            if not bundle:
+                log.warning(f"Could not find bundle for {app_path}")
+                return
+            bundle_id = bundle.bundleIdentifier()
+            self._bundle_ids_by_path[app_path] = bundle_id
 
-    def performSwitchWindow_(self, sender):
-        """
-        Perform Switch Window action (Cmd+`).
+        # Activate the app if it's already running
+        app = self._running_apps_by_bundle_id.get(bundle_id)
+        if app is not None:
+            log.debug(f"Activating {app.localizedName()}")
+            app.activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps)
+            return
 
-        Args:
-            sender: The menu item that triggered this action
-        """
-        print("Executing Switch Window (Cmd+`)")
-        self.sendKeystrokeWithModifiers_({'key_name': '`', 'modifiers': ['command']})
+        # App not running, launch it
+        log.debug(f"Launching {app_path}")
+        Cocoa.NSWorkspace.sharedWorkspace().openURL_(bundle_url)
 
-    def performEscape_(self, sender):
+    def performCopy_(self, sender):
         """
-        Perform Escape action (Esc key).
+        Perform copy action - use captured text if available, otherwise Cmd+C.
 
         Args:
             sender: The menu item that triggered this action
         """
-        print("Executing Escape")
-        self.sendKeystrokeWithModifiers_({'key_name': '\x1b', 'modifiers': []})
+        if self.captured_text:
+            log.debug(f"Copying captured text to clipboard: {self.captured_text[:50]}...")
+            pasteboard = Cocoa.NSPasteboard.generalPasteboard()
+            pasteboard.clearContents()
+            pasteboard.setString_forType_(self.captured_text, Cocoa.NSPasteboardTypeString)
+        else:
+            log.debug("Executing Copy (Cmd+C)")
+            self.sendKeystroke_('c')
 
-    def performTab_(self, sender):
+    def performCopyAndPaste_(self, sender):
         """
-        Perform Tab action (Tab key).
+        Put the captured text on the clipboard and insert it into the previous app.
+        The text is inserted through Accessibility when possible, falling back
+        to a Cmd+V keystroke.
 
         Args:
             sender: The menu item that triggered this action
         """
-        print("Executing Tab")
-        self.sendKeystrokeWithModifiers_({'key_name': '\t', 'modifiers': []})
+        if not self.captured_text:
+            log.info("No captured text to paste")
+            return
 
-    def performFind_(self, sender):
-        """
-        Perform Find action (Cmd+F).
+        log.debug(f"Pasting captured text: {self.captured_text[:50]}...")
+        pasteboard = Cocoa.NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        pasteboard.setString_forType_(self.captured_text, Cocoa.NSPasteboardTypeString)
 
-        Args:
-            sender: The menu item that triggered this action
-        """
-        print("Executing Find (Cmd+F)")
-        self.sendKeystrokeWithModifiers_({'key_name': 'f', 'modifiers': ['command']})
+        if self.previous_app:
+            if not self.previous_app.isActive():
+                self.previous_app.activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps)
+            if self.insert_text_via_accessibility(self.captured_text):
+                log.debug("Captured text inserted via Accessibility")
+                return
 
-    def performUndo_(self, sender):
+        self.sendKeystroke_('v')
+
+    def insert_text_via_accessibility(self, text):
         """
-        Perform Undo action (Cmd+Z).
+        Replace the selection in the previous app's focused element with text.
 
         Args:
-            sender: The menu item that triggered this action
-        """
-        print("Executing Undo (Cmd+Z)")
-        self.sendKeystrokeWithModifiers_({'key_name': 'z', 'modifiers': ['command']})
+            text: Text to insert
 
-    def performDeselect_(self, sender):
+        Returns:
+            True if the text was inserted, False if Accessibility is unavailable
+            or the focused element doesn't accept text
         """
-        Perform Deselect action (Cmd+D).
+        pid = self.previous_app.processIdentifier()
+        app_element = ApplicationServices.AXUIElementCreateApplication(pid)
+        focused = _copy_ax_attribute(app_element, ApplicationServices.kAXFocusedUIElementAttribute)
+        if focused is None:
+            return False
 
-        Args:
-            sender: The menu item that triggered this action
-        """
-        print("Executing Deselect (Cmd+D)")
-        self.sendKeystrokeWithModifiers_({'key_name': 'd', 'modifiers': ['command']})
+        err = ApplicationServices.AXUIElementSetAttributeValue(
+            focused,
+            ApplicationServices.kAXSelectedTextAttribute,
+            text
+        )
+        return err == ApplicationServices.kAXErrorSuccess
 
     def performRestart_(self, sender):
         """
@@ -227,10 +386,11 @@ class Actions(Cocoa.NSObject):
         Args:
             sender: The menu item that triggered this action
         """
-        print("Restarting Handy App...")
-        import os
-        python = sys.executable
-        os.execl(python, python, *sys.argv)
+        log.info("Restarting Handy App...")
+        # Rebuild after the current menu click has finished unwinding,
+        # since the restart discards this Actions instance
+        delegate = Cocoa.NSApplication.sharedApplication().delegate()
+        AppHelper.callAfter(delegate.soft_restart)
 
     def performQuit_(self, sender):
         """
@@ -239,155 +399,365 @@ class Actions(Cocoa.NSObject):
         Args:
             sender: The menu item that triggered this action
         """
-        print("Quitting Handy App...")
+        log.info("Quitting Handy App...")
         AppHelper.stopEventLoop()
         sys.exit(0)
 
-    def performSelectAll_(self, sender):
-        """
-        Perform select all action (Cmd+A).
-        """
-        print("Executing Select All (Cmd+A)")
-        self.sendKeystrokeWithModifiers_({'key_name': 'a', 'modifiers': ['command']})
-
     def performSelectAllCopy_(self, sender):
         """
         Perform select all and copy action (Cmd+A then Cmd+C).
         """
-        print("Executing Select All & Copy (Cmd+A then Cmd+C)")
-        self.sendKeystrokeWithModifiers_({'key_name': 'a', 'modifiers': ['command']})
-        # Small delay between commands
-        import time
-        time.sleep(0.15)
+        log.debug("Executing Select All & Copy (Cmd+A then Cmd+C)")
+        if self.select_all_copy_via_accessibility():
+            log.debug("Selected and copied via Accessibility")
+            return
+
+        self.send_and_wait_for_selection_change(
+            {'key_name': 'a', 'modifiers': ['command']},
+            self.SELECTION_TIMEOUT
+        )
         self.sendKeystrokeWithModifiers_({'key_name': 'c', 'modifiers': ['command']})
 
-    def performPastebot_(self, sender):
-        """
-        Perform Pastebot action (Cmd+Shift+V).
-        """
-        print("Executing Pastebot (Cmd+Shift+V)")
-        self.sendKeystrokeWithModifiers_({'key_name': 'v', 'modifiers': ['command', 'shift']})
+    def select_all_copy_via_accessibility(self):
+        """
+        Press the previous app's Edit > Select All menu item through Accessibility,
+        wait for its selection to change and copy the focused element's selected
+        text to the clipboard. Some apps (web views in particular) finish Select
+        All asynchronously, so the text is only read once the app reports the
+        new selection.
+
+        Returns:
+            True on success, False if any step isn't available via Accessibility
+            or the selection didn't change within SELECTION_TIMEOUT
+        """
+        if not self.previous_app:
+            return False
+
+        pid = self.previous_app.processIdentifier()
+        app_element = ApplicationServices.AXUIElementCreateApplication(pid)
+        focused = _copy_ax_attribute(app_element, ApplicationServices.kAXFocusedUIElementAttribute)
+        if focused is None:
+            return False
+        text_before = _copy_ax_attribute(focused, ApplicationServices.kAXSelectedTextAttribute)
+
+        # The cached menu item belongs to one process; look it up again if the
+        # app has relaunched since
+        bundle_id = self.previous_app.bundleIdentifier()
+        item = self._select_all_items.get(bundle_id)
+        if item is not None:
+            err, item_pid = ApplicationServices.AXUIElementGetPid(item, None)
+            if err != ApplicationServices.kAXErrorSuccess or item_pid != pid:
+                item = None
+        if item is None:
+            item = _find_ax_menu_item(app_element, 'Edit', 'Select All')
+            if item is None:
+                return False
+            self._select_all_items[bundle_id] = item
+
+        results = []
+        changed = self.wait_for_ax_notification(
+            ApplicationServices.kAXSelectedTextChangedNotification,
+            lambda: results.append(
+                ApplicationServices.AXUIElementPerformAction(item, ApplicationServices.kAXPressAction)
+            ),
+            self.SELECTION_TIMEOUT
+        )
+        if results[0] != ApplicationServices.kAXErrorSuccess:
+            # The cached menu item may have gone stale
+            self._select_all_items.pop(bundle_id, None)
+            return False
+        if not changed:
+            return False
+
+        text = _copy_ax_attribute(focused, ApplicationServices.kAXSelectedTextAttribute)
+        if not text or text == text_before:
+            return False
+
+        pasteboard = Cocoa.NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        pasteboard.setString_forType_(text, Cocoa.NSPasteboardTypeString)
+        return True
+
+    def send_and_wait_for_selection_change(self, args, timeout):
+        """
+        Send a keystroke, then wait until the previous app reports that its
+        selected text changed, or until the timeout expires.
 
-    def performPastePlain_(self, sender):
-        """
-        Perform Paste Without Formatting (Cmd+Option+Shift+V).
+        Args:
+            args: Keystroke dictionary passed to sendKeystrokeWithModifiers_
+            timeout: Maximum time in seconds to wait
         """
-        print("Executing Paste Without Formatting (Cmd+Option+Shift+V)")
-        self.sendKeystrokeWithModifiers_({'key_name': 'v', 'modifiers': ['command', 'shift', 'option']})
+        self.wait_for_ax_notification(
+            ApplicationServices.kAXSelectedTextChangedNotification,
+            lambda: self.sendKeystrokeWithModifiers_(args),
+            timeout
+        )
 
-    def performPixelSnap_(self, sender):
-        """
-        Perform PixelSnap action (Cmd+Option+S).
+    def wait_for_ax_notification(self, notification, trigger, timeout):
         """
-        print("Executing PixelSnap (Cmd+Option+S)")
-        self.sendKeystrokeWithModifiers_({'key_name': 's', 'modifiers': ['command', 'option']})
+        Call trigger, then wait until the previous app posts an Accessibility
+        notification, or until the timeout expires. The run loop only runs in
+        AX_WAIT_RUN_LOOP_MODE while waiting, so no other main-thread work can
+        run re-entrantly.
 
-    def performColorSlurp_(self, sender):
-        """
-        Perform ColorSlurp action (Cmd+Option+Control+C).
+        Args:
+            notification: Accessibility notification name to wait for
+            trigger: Callable that should cause the notification
+            timeout: Maximum time in seconds to wait
+
+        Returns:
+            True if the notification arrived, False on timeout or if the app
+            can't be observed (the full timeout is then waited out)
         """
-        print("Executing ColorSlurp (Cmd+Option+Control+C)")
-        self.sendKeystrokeWithModifiers_({'key_name': 'c', 'modifiers': ['command', 'option', 'control']})
+        received = []
+
+        def on_notification(observer, element, name, refcon):
+            received.append(True)
+
+        observer = None
+        if self.previous_app:
+            pid = self.previous_app.processIdentifier()
+            err, observer = ApplicationServices.AXObserverCreate(pid, on_notification, None)
+            if err == ApplicationServices.kAXErrorSuccess:
+                app_element = ApplicationServices.AXUIElementCreateApplication(pid)
+                err = ApplicationServices.AXObserverAddNotification(observer, app_element, notification, None)
+            if err != ApplicationServices.kAXErrorSuccess:
+                observer = None
+
+        if observer is not None:
+            run_loop = Cocoa.CFRunLoopGetCurrent()
+            source = ApplicationServices.AXObserverGetRunLoopSource(observer)
+            Cocoa.CFRunLoopAddSource(run_loop, source, AX_WAIT_RUN_LOOP_MODE)
+
+        trigger()
+
+        # Without an observer there's nothing to signal the change
+        if observer is None:
+            time.sleep(timeout)
+            return False
+
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while not received and remaining > 0:
+            Cocoa.CFRunLoopRunInMode(AX_WAIT_RUN_LOOP_MODE, remaining, True)
+            remaining = deadline - time.monotonic()
+
+        ApplicationServices.AXObserverRemoveNotification(observer, app_element, notification)
+        Cocoa.CFRunLoopRemoveSource(run_loop, source, AX_WAIT_RUN_LOOP_MODE)
+        return bool(received)
 
     def performScreenCapture_(self, sender):
         """
         Perform Screen Capture using native macOS screencapture command.
         """
-        print("Executing Screen Capture")
+        log.debug("Executing Screen Capture")
         try:
             # Use the native screencapture command with interactive mode
             # -i = interactive mode (click and drag to select area)
             # -c = copy to clipboard instead of saving to file
             subprocess.Popen(['screencapture', '-i', '-c'])
-            print("Screenshot tool launched")
+            log.debug("Screenshot tool launched")
         except Exception as e:
-            print(f"Error launching screenshot: {e}")
+            log.error(f"Error launching screenshot: {e}")
 
     def performDictation_(self, sender):
         """
         Perform Dictation by directly starting dictation.
         """
-        print("Executing Dictation")
-        if self.previous_app:
-            app_name = self.previous_app.localizedName()
-            print(f"Reactivating: {app_name}")
-            self.previous_app.activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps)
+        log.debug("Executing Dictation")
+        self.reactivate_previous_app()
 
+        self._script_queue.addOperationWithBlock_(lambda: self.start_dictation())
+
+    def start_dictation(self):
+        """Run the dictation AppleScripts. Called on the script queue."""
         # Use AppleScript to start dictation directly
-        script = f'''
-        delay {self.KEYSTROKE_DELAY}
-        tell application "System Events"
-            tell (first application process whose frontmost is true)
-                click menu item "Start Dictation" of menu "Edit" of menu bar 1
-            end tell
-        end tell
-        '''
+        error = self.run_apple_script(DICTATION_SCRIPT)
+        if error is None:
+            log.debug("Dictation started successfully")
+            return
+
+        log.warning(f"AppleScript error: {error}")
+        # Fallback: try using the keyboard shortcut fn+fn
+        log.info("Trying alternate method with fn key...")
         try:
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                print("Dictation started successfully")
-            else:
-                print(f"AppleScript error: {result.stderr.strip()}")
-                # Fallback: try using the keyboard shortcut fn+fn
-                print("Trying alternate method with fn key...")
-                script2 = '''
-                tell application "System Events"
-                    key code 63
-                    delay 0.1
-                    key code 63
-                end tell
-                '''
-                result2 = subprocess.run(
-                    ['osascript', '-e', script2],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                if result2.returncode == 0:
-                    print("Dictation triggered with fn key")
-                else:
-                    print(f"Fn key method also failed: {result2.stderr.strip()}")
-        except subprocess.TimeoutExpired:
-            print("Dictation trigger timed out")
+            self.press_fn_twice()
+            log.debug("Dictation triggered with fn key")
         except Exception as e:
-            print(f"Error triggering dictation: {e}")
+            log.error(f"Fn key method also failed: {e}")
+
+    def press_fn_twice(self):
+        """Post fn down/up twice back-to-back as a single burst of CGEvents."""
+        for key_down in (True, False, True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(self._event_source, FN_KEY_CODE, key_down)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
 
     def sendKeystrokeWithModifiers_(self, args):
         """
-        Send a keystroke with specified modifiers using AppleScript.
-        """
-        if self.previous_app:
-            app_name = self.previous_app.localizedName()
-            print(f"Reactivating: {app_name}")
-            self.previous_app.activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps)
+        Send a keystroke with specified modifiers to the previously active app.
+        Keys are posted directly to the app's process as CGEvents; keys without
+        a known key code fall back to AppleScript.
 
-        # Build AppleScript modifiers string
+        Args:
+            args: Dictionary with 'key_name' and 'modifiers' keys, and an optional
+                  'global' flag for shortcuts handled by another app (e.g. Alfred)
+        """
         key_name = args['key_name']
         modifiers = args['modifiers']
-        mod_str = ' using ' + ' & '.join([f'{mod} down' for mod in modifiers]) if modifiers else ''
-        script = f'''
-        delay {self.KEYSTROKE_DELAY}
-        tell application "System Events"
-            keystroke "{key_name}"{mod_str}
-        end tell
-        '''
+
+        key_code = KEY_CODES.get(key_name)
+        if key_code is None:
+            self.reactivate_previous_app()
+            self.sendAppleScriptKeystroke_(args)
+            return
+
+        # Without Accessibility access CGEvents are silently dropped, so use
+        # AppleScript, which at least reports the missing permission
+        if not self.is_accessibility_trusted():
+            self.reactivate_previous_app()
+            self.sendAppleScriptKeystroke_(args)
+            return
+
+        flags = MODIFIER_MASKS[frozenset(modifiers)]
+
         try:
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                print(f"Keystroke '{key_name}' with {modifiers} sent successfully")
+            if self.previous_app and not args.get('global'):
+                # Route the key straight to the previous app. Activation is only
+                # needed to hand focus back, so don't wait or settle for it.
+                pid = self.previous_app.processIdentifier()
+                if not self.previous_app.isActive():
+                    self.previous_app.activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps)
+                self.post_key(key_code, flags, pid)
             else:
-                print(f"AppleScript error: {result.stderr.strip()}")
-        except subprocess.TimeoutExpired:
-            print("Keystroke timed out")
+                # Global shortcuts are picked up by other apps' event taps,
+                # which only see events posted at the HID level. The key goes
+                # to whichever app is frontmost, so a late activation is
+                # learned as a failed keystroke.
+                activated = self.reactivate_previous_app()
+                self.post_key(key_code, flags)
+                if self.previous_app:
+                    self.record_keystroke_result(self.previous_app.bundleIdentifier(), activated)
+            log.debug(f"Keystroke '{key_name}' with {modifiers} sent successfully")
         except Exception as e:
-            print(f"Error sending keystroke: {e}")
+            log.error(f"Error sending keystroke: {e}")
+
+    def post_key(self, key_code, flags, pid=None):
+        """
+        Post a key down/up pair as CGEvents.
+
+        Args:
+            key_code: Mac virtual key code
+            flags: CGEventFlags modifier mask
+            pid: Process to deliver the events to, or None for the HID event tap
+        """
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(self._event_source, key_code, key_down)
+            Quartz.CGEventSetFlags(event, flags)
+            if pid is None:
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+            else:
+                Quartz.CGEventPostToPid(pid, event)
+
+    def is_accessibility_trusted(self):
+        """
+        Check whether this process may post events. Once granted the answer is
+        cached; until then it's re-checked so a new grant takes effect at once.
+        """
+        if not self._accessibility_trusted:
+            self._accessibility_trusted = ApplicationServices.AXIsProcessTrusted()
+        return self._accessibility_trusted
+
+    def sendAppleScriptKeystroke_(self, args):
+        """
+        Send a keystroke with specified modifiers using AppleScript.
+        Used for keys that have no entry in KEY_CODES, and for every key
+        while Accessibility access is missing.
+
+        Args:
+            args: Dictionary with 'key_name' and 'modifiers' keys
+        """
+        key_name = args['key_name']
+        modifiers = args['modifiers']
+        if key_name in KEY_CODES:
+            # Control characters like Escape can't be typed with keystroke
+            key_str = f'key code {KEY_CODES[key_name]}'
+        else:
+            escaped = key_name.replace('\\', '\\\\').replace('"', '\\"')
+            key_str = f'keystroke "{escaped}"'
+        script = f'''
+tell application "System Events"
+    {key_str}{MODIFIER_CLAUSES[frozenset(modifiers)]}
+end tell
+'''
+        bundle_id = self.previous_app.bundleIdentifier() if self.previous_app else None
+        self._script_queue.addOperationWithBlock_(
+            lambda: self.run_keystroke_script(script, key_name, modifiers, bundle_id)
+        )
+
+    def run_keystroke_script(self, script, key_name, modifiers, bundle_id):
+        """
+        Run a keystroke AppleScript and report errors. Called on the script
+        queue; the outcome is recorded back on the main thread.
+        """
+        error = self.run_apple_script(script)
+        if error is None:
+            log.debug(f"Keystroke '{key_name}' with {modifiers} sent successfully")
+            AppHelper.callAfter(self.record_keystroke_result, bundle_id, True)
+            return
+
+        log.warning(f"AppleScript error: {error}")
+
+        # Check if it's a permission error
+        if "not allowed" in error or "1002" in error:
+            log.warning(
+                "\n⚠️  PERMISSION NEEDED:\n"
+                "   Terminal/Warp needs permission to control your computer.\n"
+                "   Run this command to open System Settings:\n"
+                "   open 'x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility'\n"
+                "   Then manually add Warp or Terminal and enable it.\n"
+            )
+        else:
+            # Not a permissions problem, so the app may need more time
+            AppHelper.callAfter(self.record_keystroke_result, bundle_id, False)
+
+
+def _copy_ax_attribute(element, attribute):
+    """Read an Accessibility attribute, returning None if it's unavailable."""
+    err, value = ApplicationServices.AXUIElementCopyAttributeValue(element, attribute, None)
+    if err != ApplicationServices.kAXErrorSuccess:
+        return None
+    return value
+
+
+def _find_ax_menu_item(app_element, menu_title, item_title):
+    """Find a menu item by title in an app's menu bar, or return None."""
+    menu_bar = _copy_ax_attribute(app_element, ApplicationServices.kAXMenuBarAttribute)
+    if menu_bar is None:
+        return None
+
+    for bar_item in _copy_ax_attribute(menu_bar, ApplicationServices.kAXChildrenAttribute) or []:
+        if _copy_ax_attribute(bar_item, ApplicationServices.kAXTitleAttribute) != menu_title:
+            continue
+        for menu in _copy_ax_attribute(bar_item, ApplicationServices.kAXChildrenAttribute) or []:
+            for item in _copy_ax_attribute(menu, ApplicationServices.kAXChildrenAttribute) or []:
+                if _copy_ax_attribute(item, ApplicationServices.kAXTitleAttribute) == item_title:
+                    return item
+    return None
+
+
+def _make_keystroke_action(description, key_name, modifiers, is_global):
+    """Build a menu action method that sends a single keystroke."""
+    args = {'key_name': key_name, 'modifiers': modifiers}
+    if is_global:
+        args['global'] = True
+
+    def action(self, sender):
+        log.debug(f"Executing {description}")
+        self.sendKeystrokeWithModifiers_(args)
+
+    action.__doc__ = f"Perform {description}."
+    return action
+
+
+for _name, _spec in KEYSTROKE_ACTIONS.items():
+    setattr(Actions, _name, _make_keystroke_action(*_spec))
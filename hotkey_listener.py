@@ -3,12 +3,39 @@ Hotkey Listener Module
 Handles global mouse button detection.
 """
 
-from pynput import mouse
+import time
+import logging
+import threading
+import Cocoa
+import Quartz
+from actions import KEY_CODES, MODIFIER_MASKS
+
+
+log = logging.getLogger("handy.hotkey_listener")
+
+
+# Events the tap listens for. Plain mouse moves are left out so ordinary
+# pointer motion never wakes Python: hover tracking only matters while the
+# middle button is held, and those moves arrive as other-mouse-dragged events.
+EVENT_MASK = (
+    Quartz.CGEventMaskBit(Quartz.kCGEventOtherMouseDown)
+    | Quartz.CGEventMaskBit(Quartz.kCGEventOtherMouseUp)
+    | Quartz.CGEventMaskBit(Quartz.kCGEventOtherMouseDragged)
+)
+
+# Button number CGEvents report for the mouse wheel button
+MIDDLE_BUTTON = 2
 
 
 class HotkeyListener:
     """Listens for mouse wheel button presses globally."""
 
+    # Longest wait, in seconds, for the app to put the selection on the clipboard
+    COPY_TIMEOUT = 0.06
+
+    # Presses closer together than this (seconds) are treated as a bounce
+    CLICK_DEBOUNCE = 0.15
+
     def __init__(self, menu_ui):
         """
         Initialize the hotkey listener.
@@ -17,9 +44,21 @@ class HotkeyListener:
             menu_ui: MenuUI instance to show when hotkey is pressed
         """
         self.menu_ui = menu_ui
-        self.listener = None
+        self.listener = None  # Thread running the event tap's run loop
+        self._tap = None
+        self._run_loop = None
         self.captured_clipboard = None  # Temporary storage for captured clipboard
         self.middle_button_held = False  # Track if middle button is being held
+        self._last_press_time = 0.0
+        self._capture_thread = None  # Worker running the current capture, if any
+
+        # Cmd+C events are reused for every capture
+        self._event_source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+        self._copy_events = []
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(self._event_source, KEY_CODES['c'], key_down)
+            Quartz.CGEventSetFlags(event, MODIFIER_MASKS[frozenset({'command'})])
+            self._copy_events.append(event)
 
     def capture_selection_immediately(self):
         """
@@ -27,49 +66,100 @@ class HotkeyListener:
         This is needed for browsers that deselect text on middle-click.
         We use CGEvent for fastest possible execution.
         """
-        import time
-        import Cocoa
-        import Quartz
-
         try:
-            # Save current clipboard content
+            # Save current clipboard content: every item, every type (images, RTF, ...)
             pasteboard = Cocoa.NSPasteboard.generalPasteboard()
-            old_clipboard = pasteboard.stringForType_(Cocoa.NSPasteboardTypeString)
+            old_clipboard = [
+                {pasteboard_type: item.dataForType_(pasteboard_type) for pasteboard_type in item.types()}
+                for item in pasteboard.pasteboardItems() or ()
+            ]
+            initial_change_count = pasteboard.changeCount()
 
             # Send Cmd+C using CGEvent (much faster than AppleScript)
-            # Create a Cmd+C key event
-            source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
-
-            # Key code for 'C' is 8
-            key_down = Quartz.CGEventCreateKeyboardEvent(source, 8, True)
-            key_up = Quartz.CGEventCreateKeyboardEvent(source, 8, False)
-
-            # Set Command flag
-            Quartz.CGEventSetFlags(key_down, Quartz.kCGEventFlagMaskCommand)
-            Quartz.CGEventSetFlags(key_up, Quartz.kCGEventFlagMaskCommand)
+            for event in self._copy_events:
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
 
-            # Post the events
-            Quartz.CGEventPost(Quartz.kCGHIDEventTap, key_down)
-            Quartz.CGEventPost(Quartz.kCGHIDEventTap, key_up)
-
-            # Wait for clipboard to update
-            time.sleep(0.1)
+            # Wait for the clipboard to update. Usually takes a few ms; give up
+            # after COPY_TIMEOUT (nothing selected means no change at all).
+            deadline = time.monotonic() + self.COPY_TIMEOUT
+            while pasteboard.changeCount() == initial_change_count and time.monotonic() < deadline:
+                time.sleep(0.002)
 
             # Read the newly captured text
             self.captured_clipboard = pasteboard.stringForType_(Cocoa.NSPasteboardTypeString)
 
-            # Restore the old clipboard content
-            if old_clipboard:
-                pasteboard.clearContents()
-                pasteboard.setString_forType_(old_clipboard, Cocoa.NSPasteboardTypeString)
-                print(f"Captured selection to temporary storage (restored original clipboard)")
+            # Restore the old clipboard content in the background so the menu
+            # can show right away. Nothing to restore if the copy didn't land
+            # or just copied what was already there.
+            if (old_clipboard and pasteboard.changeCount() != initial_change_count
+                    and not self.clipboard_matches(pasteboard, old_clipboard)):
+                threading.Thread(
+                    target=self.restore_clipboard, args=(pasteboard, old_clipboard), daemon=True
+                ).start()
+                log.debug("Captured selection to temporary storage (restoring original clipboard)")
             else:
-                print(f"Captured selection to temporary storage")
+                log.debug("Captured selection to temporary storage")
 
         except Exception as e:
-            print(f"Error capturing selection: {e}")
+            log.error(f"Error capturing selection: {e}")
             self.captured_clipboard = None
 
+    def capture_and_show_menu(self, x, y):
+        """
+        Capture the selection, then show the menu (runs on a worker thread).
+        The menu waits for the capture: showing it activates Handy, which would
+        otherwise steal the Cmd+C from the app that owns the selection.
+
+        Args:
+            x: Mouse x coordinate
+            y: Mouse y coordinate
+        """
+        # Capture selection BEFORE showing menu (helps with browsers that deselect on middle-click)
+        self.capture_selection_immediately()
+        # Pass captured clipboard to menu UI
+        self.menu_ui.set_captured_text(self.captured_clipboard)
+        self.menu_ui.show_menu(x, y)
+
+    def clipboard_matches(self, pasteboard, contents):
+        """
+        Check whether the pasteboard holds the same text as saved contents.
+
+        Args:
+            pasteboard: NSPasteboard to compare
+            contents: List of pasteboard items, each a dictionary of type to NSData
+
+        Returns:
+            True if both hold a single item with the same types and text
+        """
+        if len(contents) != 1:
+            return False
+        old_item = contents[0]
+        old_text = old_item.get(Cocoa.NSPasteboardTypeString)
+        if old_text is None or set(old_item) != set(pasteboard.types() or ()):
+            return False
+        return old_text.isEqualToData_(pasteboard.dataForType_(Cocoa.NSPasteboardTypeString))
+
+    def restore_clipboard(self, pasteboard, contents):
+        """
+        Put saved clipboard contents back on the pasteboard.
+
+        Args:
+            pasteboard: NSPasteboard to restore
+            contents: List of pasteboard items, each a dictionary of type to NSData
+        """
+        try:
+            items = []
+            for item_contents in contents:
+                item = Cocoa.NSPasteboardItem.alloc().init()
+                for pasteboard_type, data in item_contents.items():
+                    if data is not None:
+                        item.setData_forType_(data, pasteboard_type)
+                items.append(item)
+            pasteboard.clearContents()
+            pasteboard.writeObjects_(items)
+        except Exception as e:
+            log.error(f"Error restoring clipboard: {e}")
+
     def on_move(self, x, y):
         """
         Callback for mouse move events.
@@ -82,44 +172,89 @@ class HotkeyListener:
         if self.middle_button_held and self.menu_ui.is_menu_visible():
             self.menu_ui.update_hover_at_position(x, y)
 
-    def on_click(self, x, y, button, pressed):
+    def on_click(self, x, y, pressed):
         """
-        Callback for mouse click events.
+        Callback for middle button (mouse wheel) click events.
 
         Args:
             x: Mouse x coordinate
             y: Mouse y coordinate
-            button: Mouse button that was clicked
             pressed: True if pressed, False if released
         """
-        # Check for middle button (mouse wheel)
-        if button == mouse.Button.middle:
-            if pressed:
-                # Middle button pressed
-                self.middle_button_held = True
-                # Toggle menu: close if open, show if closed
-                if self.menu_ui.is_menu_visible():
-                    print("Mouse wheel clicked - closing menu")
-                    self.menu_ui.close_menu()
-                else:
-                    print(f"Mouse wheel clicked at ({x}, {y})")
-                    # Capture selection BEFORE showing menu (helps with browsers that deselect on middle-click)
-                    self.capture_selection_immediately()
-                    # Pass captured clipboard to menu UI
-                    self.menu_ui.set_captured_text(self.captured_clipboard)
-                    self.menu_ui.show_menu(x, y)
-            else:
-                # Middle button released
-                if self.middle_button_held and self.menu_ui.is_menu_visible():
-                    print(f"Mouse wheel released at ({x}, {y}) - triggering menu item")
-                    self.menu_ui.trigger_item_at_cursor()
-                self.middle_button_held = False
+        if pressed:
+            # Ignore rapid repeat presses so they don't race an in-progress capture
+            now = time.monotonic()
+            if now - self._last_press_time < self.CLICK_DEBOUNCE:
+                return
+            self._last_press_time = now
+
+            # Middle button pressed
+            self.middle_button_held = True
+            # Toggle menu: close if open, show if closed
+            if self.menu_ui.is_menu_visible():
+                log.debug("Mouse wheel clicked - closing menu")
+                self.menu_ui.close_menu()
+            elif not (self._capture_thread and self._capture_thread.is_alive()):
+                log.debug(f"Mouse wheel clicked at ({x}, {y})")
+                # Capture off the event tap thread so the callback returns at once
+                self._capture_thread = threading.Thread(
+                    target=self.capture_and_show_menu, args=(x, y), daemon=True
+                )
+                self._capture_thread.start()
+        else:
+            # Middle button released
+            if self.middle_button_held and self.menu_ui.is_menu_visible():
+                log.debug(f"Mouse wheel released at ({x}, {y}) - triggering menu item")
+                self.menu_ui.trigger_item_at_cursor()
+            self.middle_button_held = False
+
+    def handle_event(self, proxy, event_type, event, refcon):
+        """
+        CGEventTap callback. Filters for the middle button natively and only
+        then dispatches to on_click/on_move. The tap is listen-only, so the
+        event is always passed through unchanged.
+        """
+        if event_type in (Quartz.kCGEventTapDisabledByTimeout, Quartz.kCGEventTapDisabledByUserInput):
+            # macOS disables taps that respond too slowly; turn it back on
+            Quartz.CGEventTapEnable(self._tap, True)
+            return event
+
+        if Quartz.CGEventGetIntegerValueField(event, Quartz.kCGMouseEventButtonNumber) != MIDDLE_BUTTON:
+            return event
+
+        # Global display coordinates, top-left origin
+        location = Quartz.CGEventGetLocation(event)
+        if event_type == Quartz.kCGEventOtherMouseDragged:
+            self.on_move(location.x, location.y)
+        else:
+            self.on_click(location.x, location.y, event_type == Quartz.kCGEventOtherMouseDown)
+        return event
+
+    def run_tap(self):
+        """Create the event tap and run its run loop (on the listener thread)."""
+        self._tap = Quartz.CGEventTapCreate(
+            Quartz.kCGSessionEventTap,
+            Quartz.kCGHeadInsertEventTap,
+            Quartz.kCGEventTapOptionListenOnly,
+            EVENT_MASK,
+            self.handle_event,
+            None
+        )
+        if self._tap is None:
+            log.error("⚠️  Could not create event tap - grant Input Monitoring and Accessibility access")
+            return
+
+        source = Quartz.CFMachPortCreateRunLoopSource(None, self._tap, 0)
+        self._run_loop = Quartz.CFRunLoopGetCurrent()
+        Quartz.CFRunLoopAddSource(self._run_loop, source, Quartz.kCFRunLoopCommonModes)
+        Quartz.CGEventTapEnable(self._tap, True)
+        Quartz.CFRunLoopRun()
 
     def start(self):
         """Start listening for mouse events."""
-        self.listener = mouse.Listener(on_click=self.on_click, on_move=self.on_move)
+        self.listener = threading.Thread(target=self.run_tap, daemon=True)
         self.listener.start()
-        print("Listening for mouse wheel button press...")
+        log.info("Listening for mouse wheel button press...")
 
     def join(self):
         """Wait for the listener thread to finish."""
@@ -128,5 +263,7 @@ class HotkeyListener:
 
     def stop(self):
         """Stop listening for mouse events."""
-        if self.listener:
-            self.listener.stop()
+        if self._tap is not None:
+            Quartz.CGEventTapEnable(self._tap, False)
+        if self._run_loop is not None:
+            Quartz.CFRunLoopStop(self._run_loop)
@@ -1,14 +1,50 @@
 """
 Icon Helper
-Utility to get absolute paths for icons.
+Utility to get absolute paths for icons, and the shared prerendered icon cache.
 """
 
 import os
+import logging
+import Cocoa
+
+
+log = logging.getLogger("handy.icon_helper")
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ICONS_DIR = os.path.join(SCRIPT_DIR, 'icons')
 
+# Image file extensions list_icons() reports
+ICON_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.webp'}
+
+# Icon file name -> absolute path, filled by a single directory scan
+_icon_paths = {}
+
+# Every menu view prerenders its icons at this many pixels per point (Retina)
+ICON_RENDER_SCALE = 2
+
+# Most prerendered icons kept in the cache at once
+ICON_CACHE_LIMIT = 64
+
+# Prerendered icons for every menu view, keyed by "path|mtime|bytes|size|Npx|rR".
+# The file's modification time and size are part of the key, so an icon
+# edited on disk is picked up on the next load. NSCache is thread-safe and
+# evicts under memory pressure or past the limit; an evicted icon is simply
+# loaded again.
+_ICON_CACHE = Cocoa.NSCache.alloc().init()
+_ICON_CACHE.setCountLimit_(ICON_CACHE_LIMIT)
+
+
+def refresh_icon_cache():
+    """Rescan the icons directory (e.g. after adding icons)."""
+    _icon_paths.clear()
+    if not os.path.isdir(ICONS_DIR):
+        return
+    with os.scandir(ICONS_DIR) as entries:
+        for entry in entries:
+            if entry.is_file():
+                _icon_paths[entry.name] = entry.path
+
 
 def icon_path(filename):
     """
@@ -20,20 +56,131 @@ def icon_path(filename):
     Returns:
         Absolute path to the icon file, or None if it doesn't exist
     """
-    path = os.path.join(ICONS_DIR, filename)
-    return path if os.path.exists(path) else None
+    return _icon_paths.get(filename)
 
 
 def list_icons():
     """List all icon files in the icons directory."""
-    if not os.path.exists(ICONS_DIR):
-        return []
-
-    icons = []
-    for file in os.listdir(ICONS_DIR):
-        if file.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
-            icons.append(file)
-    return icons
+    return [
+        file for file in _icon_paths
+        if os.path.splitext(file)[1].lower() in ICON_EXTENSIONS
+    ]
+
+
+def icon_cache_key(path, size, corner_radius, scale):
+    """
+    Build the cache key for a prerendered icon from the file's current state.
+
+    Args:
+        path: Path to the icon file
+        size: Size the icon is shown at, in points
+        corner_radius: Corner radius in points
+        scale: Pixels per point to render at
+
+    Returns:
+        Key string, or None if the file can't be read
+    """
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        log.error(f"Error loading icon {path}: {e}")
+        return None
+    pixels = int(round(size * scale))
+    return f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{size}|{pixels}px|r{corner_radius}"
+
+
+def cached_icon(path, size, corner_radius=0, scale=ICON_RENDER_SCALE):
+    """
+    Return an already prerendered icon without loading it.
+
+    Args:
+        path: Path to the icon file
+        size: Size the icon is shown at, in points
+        corner_radius: Corner radius in points
+        scale: Pixels per point to render at
+
+    Returns:
+        NSImage, or None if it isn't in the cache
+    """
+    key = icon_cache_key(path, size, corner_radius, scale)
+    return _ICON_CACHE.objectForKey_(key) if key else None
+
+
+def load_icon(path, size, corner_radius=0, scale=ICON_RENDER_SCALE):
+    """
+    Load an icon, prerender it at its display size with rounded corners and
+    cache it. Safe to call off the main thread.
+
+    Args:
+        path: Path to the icon file (PNG, JPEG, WebP)
+        size: Size the icon is shown at, in points
+        corner_radius: Corner radius in points (half the size for a circle)
+        scale: Pixels per point to render at
+
+    Returns:
+        NSImage holding a single bitmap, or None if loading fails
+    """
+    key = icon_cache_key(path, size, corner_radius, scale)
+    if key is None:
+        return None
+    icon = _ICON_CACHE.objectForKey_(key)
+    if icon is not None:
+        return icon
+
+    try:
+        source = Cocoa.NSImage.alloc().initWithContentsOfFile_(path)
+        if source:
+            icon = prerender_icon(source, size, corner_radius, scale)
+            _ICON_CACHE.setObject_forKey_(icon, key)
+            return icon
+    except Exception as e:
+        log.error(f"Error loading icon {path}: {e}")
+
+    return None
+
+
+def prerender_icon(source, size, corner_radius, scale):
+    """
+    Rasterize an icon once at its exact on-screen pixel size with its rounded
+    corners baked in, so showing it never resamples the full-size source image
+    or masks a layer.
+
+    Args:
+        source: Decoded NSImage
+        size: Icon size in points
+        corner_radius: Corner radius in points (0 for square corners)
+        scale: Pixels per point
+
+    Returns:
+        NSImage holding a single bitmap
+    """
+    pixels = int(round(size * scale))
+    bitmap = Cocoa.NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
+        None, pixels, pixels, 8, 4, True, False, Cocoa.NSDeviceRGBColorSpace, 0, 0
+    )
+    bitmap.setSize_(Cocoa.NSMakeSize(size, size))
+
+    Cocoa.NSGraphicsContext.saveGraphicsState()
+    Cocoa.NSGraphicsContext.setCurrentContext_(
+        Cocoa.NSGraphicsContext.graphicsContextWithBitmapImageRep_(bitmap)
+    )
+    icon_rect = Cocoa.NSMakeRect(0, 0, size, size)
+    if corner_radius:
+        Cocoa.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(icon_rect, corner_radius, corner_radius).addClip()
+    source.drawInRect_fromRect_operation_fraction_(
+        icon_rect,
+        Cocoa.NSZeroRect,
+        Cocoa.NSCompositeSourceOver,
+        1.0
+    )
+    Cocoa.NSGraphicsContext.restoreGraphicsState()
+
+    icon = Cocoa.NSImage.alloc().initWithSize_(Cocoa.NSMakeSize(size, size))
+    icon.addRepresentation_(bitmap)
+    return icon
+
+
+refresh_icon_cache()
 
 
 if __name__ == '__main__':
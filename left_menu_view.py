@@ -3,12 +3,59 @@ Left Menu View Module
 Creates a vertical menu bar to the left of the pie menu for quick app access.
 """
 
+import time
+import logging
 import objc
 import Cocoa
+import Quartz
+from icon_helper import cached_icon, load_icon
+from view_helper import backing_scale, run_menu_item, set_hover_fill
+
+
+log = logging.getLogger("handy.left_menu_view")
+
+
+# Button colors
+FILL_COLOR = Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.25, 0.25, 0.25, 0.85).CGColor()
+HOVER_FILL_COLOR = Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.35, 0.35, 0.35, 0.9).CGColor()
+BORDER_COLOR = Cocoa.NSColor.colorWithCalibratedWhite_alpha_(0.9, 0.5).CGColor()
+
+# Button title text: 12 pt white, centered, wrapping
+_paragraph_style = Cocoa.NSMutableParagraphStyle.alloc().init()
+_paragraph_style.setAlignment_(Cocoa.NSTextAlignmentCenter)
+_paragraph_style.setLineBreakMode_(Cocoa.NSLineBreakByWordWrapping)
+TITLE_ATTRIBUTES = {
+    Cocoa.NSFontAttributeName: Cocoa.NSFont.systemFontOfSize_(12),
+    Cocoa.NSForegroundColorAttributeName: Cocoa.NSColor.whiteColor(),
+    Cocoa.NSParagraphStyleAttributeName: _paragraph_style,
+}
+
+# Attributed button titles, built once per title and reused on every show
+_title_strings = {}
+
+# Background queue that decodes and prerenders icons, so the menu can show
+# before its icons are ready
+_icon_queue = Cocoa.NSOperationQueue.alloc().init()
+_icon_queue.setMaxConcurrentOperationCount_(2)
+
+# Shown in an icon's place until it has been decoded
+ICON_PLACEHOLDER_COLOR = Cocoa.NSColor.colorWithCalibratedWhite_alpha_(0.5, 0.3).CGColor()
+
+# Minimum time between hover updates from mouse moves (one per 60 Hz frame)
+HOVER_INTERVAL = 1.0 / 60
 
 
 class LeftMenuView(Cocoa.NSView):
-    """Custom view that draws a vertical menu bar with clickable buttons."""
+    """Custom layer-backed view showing a vertical menu bar with clickable buttons."""
+
+    # === ADJUSTABLE PARAMETERS (layout and hit testing both use these) ===
+    BUTTON_SPACING = 6              # Space between buttons
+    VERTICAL_BUTTON_PADDING = 8     # Padding inside button (top and bottom)
+    ICON_TEXT_SPACING = 4           # Space between icon and text
+    ICON_SIZE = 30                  # Icon size
+    ICON_CORNER_RADIUS = 4          # Icon corner rounding
+    TEXT_HEIGHT = 12                # Approximate text height
+    # =====================================================================
 
     def initWithFrame_(self, frame):
         """Initialize the left menu view."""
@@ -19,7 +66,22 @@ class LeftMenuView(Cocoa.NSView):
         self.menu_items = []
         self.hovered_index = -1
         self.tracking_area = None
-        self.icon_cache = {}  # Cache loaded icons
+        self.button_layers = []  # Button shape layers, by menu item index
+        self.button_rects = []  # Button frames, by menu item index
+        self.layout_start_y = 0.0  # Bottom edge of the lowest button
+        self.button_stride = 0.0  # Button height plus spacing
+        self.layer_scale = 1.0  # Backing scale the layers were built for
+
+        # Mouse-move hover throttling: latest point, pending timer, last update time
+        self.pending_hover_point = None
+        self.hover_timer = None
+        self.last_hover_update = 0.0
+        self.last_mouse_point = None
+
+        self.setWantsLayer_(True)
+        # Everything is drawn by sublayers, so AppKit never needs to redraw
+        # the view's own layer, not on resize, window moves or display changes
+        self.setLayerContentsRedrawPolicy_(Cocoa.NSViewLayerContentsRedrawNever)
 
         return self
 
@@ -46,168 +108,230 @@ class LeftMenuView(Cocoa.NSView):
         self.addTrackingArea_(self.tracking_area)
 
     def resetCursorRects(self):
-        """Set up cursor rectangles for the entire view."""
+        """Show the pointing hand over buttons; AppKit uses the arrow elsewhere."""
         objc.super(LeftMenuView, self).resetCursorRects()
-        self.addCursorRect_cursor_(self.bounds(), Cocoa.NSCursor.pointingHandCursor())
+        cursor = Cocoa.NSCursor.pointingHandCursor()
+        for button_rect in self.button_rects:
+            self.addCursorRect_cursor_(button_rect, cursor)
 
     def setMenuItems_(self, items):
         """
         Set the menu items to display.
 
         Args:
-            items: List of dictionaries with 'title', 'action', and 'target'
+            items: List of MenuItem tuples (see menu_ui)
         """
         self.menu_items = items
-        self.setNeedsDisplay_(True)
-
-    def drawRect_(self, rect):
-        """
-        Draw the left menu as a vertical column.
-
-        Args:
-            rect: The rectangle to draw in
-        """
-        if not self.menu_items:
-            return
+        self.buildButtonLayers()
 
+    def layoutButtons(self):
+        """Compute every button's frame from the class parameters and current bounds."""
         bounds = self.bounds()
         num_items = len(self.menu_items)
 
-        if num_items == 0:
-            return
-
-        # === ADJUSTABLE PARAMETERS ===
-        button_spacing = 6              # Space between buttons
-        vertical_button_padding = 8     # Padding inside button (top and bottom)
-        icon_text_spacing = 4           # Space between icon and text
-        icon_size = 30                  # Icon size
-        text_height = 12                # Approximate text height
-        # ============================
-
         # Calculate button height based on content
-        button_height = (vertical_button_padding * 2) + icon_size + icon_text_spacing + text_height
+        button_height = (
+            (self.VERTICAL_BUTTON_PADDING * 2) + self.ICON_SIZE + self.ICON_TEXT_SPACING + self.TEXT_HEIGHT
+        )
         button_width = bounds.size.width
 
         # Calculate total grid height
-        total_grid_height = (num_items * button_height) + ((num_items - 1) * button_spacing)
+        total_grid_height = (num_items * button_height) + ((num_items - 1) * self.BUTTON_SPACING)
 
         # Center the buttons vertically
         start_y = (bounds.size.height - total_grid_height) / 2
 
-        # Draw each button vertically (reversed so top of array = top of menu)
-        for i, item in enumerate(reversed(self.menu_items)):
-            y_offset = start_y + i * (button_height + button_spacing)
+        # Kept for the constant-time hit test
+        self.layout_start_y = start_y
+        self.button_stride = button_height + self.BUTTON_SPACING
 
-            button_rect = Cocoa.NSMakeRect(
+        # Top of array = top of menu, so the last item is at the bottom
+        self.button_rects = [
+            Cocoa.NSMakeRect(
                 0,
-                y_offset,
+                start_y + (num_items - 1 - index) * (button_height + self.BUTTON_SPACING),
                 button_width,
                 button_height
             )
+            for index in range(num_items)
+        ]
 
-            # Create rounded rectangle path
-            path = Cocoa.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-                button_rect,
-                5,
-                5
-            )
+        # Cursor rects follow the buttons
+        window = self.window()
+        if window:
+            window.invalidateCursorRectsForView_(self)
 
-            # Fill color - highlight if hovered
-            # i is visual index (0 = top), convert to array index for comparison
-            array_index = num_items - 1 - i
-            if array_index == self.hovered_index:
-                Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.35, 0.35, 0.35, 0.9).setFill()
-            else:
-                Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.25, 0.25, 0.25, 0.85).setFill()
-
-            path.fill()
-
-            # Draw border
-            Cocoa.NSColor.colorWithCalibratedWhite_alpha_(0.9, 0.5).setStroke()
-            path.setLineWidth_(1.0)
-            path.stroke()
-
-            # Draw icon if available
-            if 'icon' in item and item['icon']:
-                icon = self.loadIcon_(item['icon'])
-                if icon:
-                    icon_x = (button_width - icon_size) / 2
-                    icon_y = y_offset + vertical_button_padding + text_height + icon_text_spacing
-                    icon_rect = Cocoa.NSMakeRect(
-                        icon_x,
-                        icon_y,
-                        icon_size,
-                        icon_size
-                    )
-
-                    # Save graphics state
-                    Cocoa.NSGraphicsContext.currentContext().saveGraphicsState()
-
-                    # Create rounded rectangle clipping path for icon
-                    icon_corner_radius = 4
-                    icon_clip_path = Cocoa.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-                        icon_rect,
-                        icon_corner_radius,
-                        icon_corner_radius
-                    )
-                    icon_clip_path.addClip()
-
-                    # Draw the icon
-                    icon.drawInRect_fromRect_operation_fraction_(
-                        icon_rect,
-                        Cocoa.NSZeroRect,
-                        Cocoa.NSCompositeSourceOver,
-                        1.0
-                    )
-
-                    # Restore graphics state
-                    Cocoa.NSGraphicsContext.currentContext().restoreGraphicsState()
-
-            # Draw text label below the icon
-            paragraph_style = Cocoa.NSMutableParagraphStyle.alloc().init()
-            paragraph_style.setAlignment_(Cocoa.NSTextAlignmentCenter)
-            paragraph_style.setLineBreakMode_(Cocoa.NSLineBreakByWordWrapping)
-
-            attributes = {
-                Cocoa.NSFontAttributeName: Cocoa.NSFont.systemFontOfSize_(text_height),
-                Cocoa.NSForegroundColorAttributeName: Cocoa.NSColor.whiteColor(),
-                Cocoa.NSParagraphStyleAttributeName: paragraph_style
-            }
-
-            title = Cocoa.NSString.stringWithString_(item['title'])
-            text_max_width = button_width - 4
-            text_rect = Cocoa.NSMakeRect(
-                2,
-                y_offset + vertical_button_padding,
-                text_max_width,
-                text_height
-            )
-            title.drawInRect_withAttributes_(text_rect, attributes)
+    def buildButtonLayers(self):
+        """
+        Build one layer tree per button: a rounded shape layer for the chrome
+        with an icon layer and a text layer on top. Hovering then only swaps a
+        shape layer's fill color, so the view never has to redraw.
+        """
+        for layer in self.button_layers:
+            layer.removeFromSuperlayer()
+        self.button_layers = []
+        self.layer_scale = self.backingScale()
+
+        self.layoutButtons()
+        num_items = len(self.menu_items)
+        if num_items == 0:
+            return
+
+        vertical_button_padding = self.VERTICAL_BUTTON_PADDING
+        icon_size = self.ICON_SIZE
+        text_height = self.TEXT_HEIGHT
+        button_size = self.button_rects[0].size
+        button_width = button_size.width
+
+        # Every button has the same rounded rect, in its own coordinates
+        button_path = Quartz.CGPathCreateWithRoundedRect(
+            Quartz.CGRectMake(0, 0, button_width, button_size.height), 5, 5, None
+        )
+        scale = self.layer_scale
+
+        for item, button_rect in zip(self.menu_items, self.button_rects):
+            button_layer = Quartz.CAShapeLayer.layer()
+            button_layer.setFrame_(button_rect)
+            button_layer.setPath_(button_path)
+            button_layer.setFillColor_(FILL_COLOR)
+            button_layer.setStrokeColor_(BORDER_COLOR)
+            button_layer.setLineWidth_(1.0)
+
+            # Icon, prerendered with its rounded corners
+            if item.icon:
+                icon_layer = Quartz.CALayer.layer()
+                icon_layer.setFrame_(Quartz.CGRectMake(
+                    (button_width - icon_size) / 2,
+                    vertical_button_padding + text_height + self.ICON_TEXT_SPACING,
+                    icon_size,
+                    icon_size
+                ))
+                icon_layer.setContentsScale_(scale)
+                self.setIconForLayer_path_size_(icon_layer, item.icon, icon_size)
+                button_layer.addSublayer_(icon_layer)
+
+            # Text label below the icon
+            title_layer = Quartz.CATextLayer.layer()
+            title_layer.setFrame_(Quartz.CGRectMake(2, vertical_button_padding, button_width - 4, text_height))
+            title_layer.setString_(self.titleString_(item.title))
+            title_layer.setWrapped_(True)
+            title_layer.setContentsScale_(scale)
+            button_layer.addSublayer_(title_layer)
+
+            self.layer().addSublayer_(button_layer)
+            self.button_layers.append(button_layer)
+
+        if 0 <= self.hovered_index < num_items:
+            self.button_layers[self.hovered_index].setFillColor_(HOVER_FILL_COLOR)
+
+    def titleString_(self, title):
+        """
+        Return the attributed string for a button title, building it on first use.
+
+        Args:
+            title: Button title
+
+        Returns:
+            NSAttributedString with TITLE_ATTRIBUTES
+        """
+        title_string = _title_strings.get(title)
+        if title_string is None:
+            title_string = Cocoa.NSAttributedString.alloc().initWithString_attributes_(title, TITLE_ATTRIBUTES)
+            _title_strings[title] = title_string
+        return title_string
+
+    def backingScale(self):
+        """Return the backing scale factor for crisp text on Retina displays."""
+        return backing_scale(self)
+
+    def viewDidChangeBackingProperties(self):
+        """Rebuild the button layers and icons for the new display scale."""
+        objc.super(LeftMenuView, self).viewDidChangeBackingProperties()
+        if self.backingScale() != self.layer_scale:
+            self.buildButtonLayers()
 
     def mouseMoved_(self, event):
         """Handle mouse movement for hover effect."""
         point = self.convertPoint_fromView_(event.locationInWindow(), None)
-        index = self.getButtonIndexAtPoint_(point)
 
-        # Update cursor based on whether we're over a button
-        if index >= 0:
-            Cocoa.NSCursor.pointingHandCursor().set()
-        else:
-            Cocoa.NSCursor.arrowCursor().set()
+        # Sub-pixel and repeated events often land on the same point
+        last_point = self.last_mouse_point
+        if last_point is not None and point.x == last_point.x and point.y == last_point.y:
+            return
+        self.last_mouse_point = point
+
+        self.scheduleHoverUpdate_(point)
+
+    def scheduleHoverUpdate_(self, point):
+        """
+        Apply hover for the latest mouse point at most once per frame.
+        The first move in a frame is applied at once; later ones only replace
+        the pending point, which a one-shot timer applies at the next frame.
+
+        Args:
+            point: NSPoint in view coordinates
+        """
+        self.pending_hover_point = point
+        if self.hover_timer is not None:
+            return
+
+        elapsed = time.monotonic() - self.last_hover_update
+        if elapsed >= HOVER_INTERVAL:
+            self.flushHoverUpdate_(None)
+            return
+
+        self.hover_timer = Cocoa.NSTimer.timerWithTimeInterval_target_selector_userInfo_repeats_(
+            HOVER_INTERVAL - elapsed,
+            self,
+            'flushHoverUpdate:',
+            None,
+            False
+        )
+        # Common modes so the timer also fires while a drag is being tracked
+        Cocoa.NSRunLoop.currentRunLoop().addTimer_forMode_(self.hover_timer, Cocoa.NSRunLoopCommonModes)
 
-        self.updateHoveredIndex_(point)
+    def flushHoverUpdate_(self, timer):
+        """Apply the pending hover point (called directly or by the hover timer)."""
+        self.hover_timer = None
+        self.last_hover_update = time.monotonic()
+        if self.pending_hover_point is not None:
+            self.updateHoveredIndex_(self.pending_hover_point)
 
     def mouseDragged_(self, event):
         """Handle left mouse button drag."""
-        self.mouseMoved_(event)
+        self.mouseMoved_(self.latestEventLike_(event))
 
     def rightMouseDragged_(self, event):
         """Handle right mouse button drag."""
-        self.mouseMoved_(event)
+        self.mouseMoved_(self.latestEventLike_(event))
 
     def otherMouseDragged_(self, event):
         """Handle other mouse button drag (middle button)."""
-        self.mouseMoved_(event)
+        self.mouseMoved_(self.latestEventLike_(event))
+
+    def latestEventLike_(self, event):
+        """
+        Drain drag events of the same type already waiting in the queue and
+        return the newest, so a fast drag costs one hover update, not a backlog.
+
+        Args:
+            event: The drag event being handled
+
+        Returns:
+            The most recent queued event of the same type, or event itself
+        """
+        app = Cocoa.NSApplication.sharedApplication()
+        mask = 1 << event.type()  # NSEventMaskFromType
+        while True:
+            newer = app.nextEventMatchingMask_untilDate_inMode_dequeue_(
+                mask,
+                Cocoa.NSDate.distantPast(),
+                Cocoa.NSEventTrackingRunLoopMode,
+                True
+            )
+            if newer is None:
+                return event
+            event = newer
 
     def mouseDown_(self, event):
         """Handle mouse click to select menu item."""
@@ -215,59 +339,15 @@ class LeftMenuView(Cocoa.NSView):
         index = self.getButtonIndexAtPoint_(point)
 
         if index >= 0 and index < len(self.menu_items):
-            item = self.menu_items[index]
-            target = item['target']
-            action = item['action']
-
-            # Call the action
-            if target and action:
-                try:
-                    # Check if this action needs an app_path parameter
-                    if 'app_path' in item:
-                        target.performSelector_withObject_(action, {'path': item['app_path']})
-                    else:
-                        target.performSelector_withObject_(action, None)
-                except Exception as e:
-                    print(f"Error calling action {action}: {e}")
-
-            # Close the menu by hiding it
-            window = self.window()
-            if window:
-                window.orderOut_(None)
+            run_menu_item(self, self.menu_items[index])
 
     def updateHoveredIndex_(self, point):
         """Update which button is being hovered."""
-        # Get the visual index (which button on screen)
-        bounds = self.bounds()
-        num_items = len(self.menu_items)
-
-        if num_items == 0:
-            new_index = -1
-        else:
-            # Calculate parameters
-            button_spacing = 4
-            vertical_button_padding = 6
-            icon_text_spacing = 4
-            icon_size = 30
-            text_height = 12
-            button_height = (vertical_button_padding * 2) + icon_size + icon_text_spacing + text_height
-            total_grid_height = (num_items * button_height) + ((num_items - 1) * button_spacing)
-            start_y = (bounds.size.height - total_grid_height) / 2
-            button_width = bounds.size.width
-
-            # Find which visual button (0 = top button on screen)
-            new_index = -1
-            for i in range(num_items):
-                y_offset = start_y + i * (button_height + button_spacing)
-                if (point.x >= 0 and point.x <= button_width and
-                    point.y >= y_offset and point.y <= y_offset + button_height):
-                    # Convert visual index to array index (reversed)
-                    new_index = num_items - 1 - i
-                    break
+        new_index = self.getButtonIndexAtPoint_(point)
 
         if new_index != self.hovered_index:
+            set_hover_fill(self.button_layers, self.hovered_index, new_index, FILL_COLOR, HOVER_FILL_COLOR)
             self.hovered_index = new_index
-            self.setNeedsDisplay_(True)
 
     def getButtonIndexAtPoint_(self, point):
         """
@@ -279,62 +359,56 @@ class LeftMenuView(Cocoa.NSView):
         Returns:
             Index of the button, or -1 if not in any button
         """
-        bounds = self.bounds()
-        num_items = len(self.menu_items)
-
+        num_items = len(self.button_rects)
         if num_items == 0:
             return -1
 
-        # === Adjustable parameters (must match drawRect_) ===
-        button_spacing = 4
-        vertical_button_padding = 6
-        icon_text_spacing = 4
-        icon_size = 30
-        text_height = 12
-        # === End parameters ===
-
-        # Calculate button dimensions
-        total_height = bounds.size.height
-        button_width = bounds.size.width
-        button_height = (vertical_button_padding * 2) + icon_size + icon_text_spacing + text_height
+        # Buttons form a uniform column, so the slot follows directly from y
+        button_size = self.button_rects[0].size
+        if not 0 <= point.x < button_size.width:
+            return -1
+        offset = point.y - self.layout_start_y
+        if offset < 0:
+            return -1
+        slot = int(offset // self.button_stride)
+        if slot >= num_items or offset - slot * self.button_stride >= button_size.height:
+            return -1  # Above the column or in the gap between buttons
 
-        # Calculate vertical centering
-        total_grid_height = (button_height * num_items) + (button_spacing * (num_items - 1))
-        start_y = (bounds.size.height - total_grid_height) / 2
+        # Slot 0 is the bottom button, which is the last item
+        return num_items - 1 - slot
 
-        # Check each button (reversed to match rendering)
-        for i in range(num_items):
-            y_offset = start_y + i * (button_height + button_spacing)
+    def setIconForLayer_path_size_(self, icon_layer, icon_path, size):
+        """
+        Give an icon layer its prerendered icon. A cached icon is set at once;
+        otherwise the layer shows a placeholder while the icon is decoded on
+        the background queue, and gets its contents back on the main thread.
+        Icons render at ICON_RENDER_SCALE, like the other menus, so the ones
+        menu_ui preloaded are always cache hits.
 
-            if (point.x >= 0 and point.x <= button_width and
-                point.y >= y_offset and point.y <= y_offset + button_height):
-                return num_items - 1 - i
+        Args:
+            icon_layer: CALayer to show the icon in
+            icon_path: Path to the icon file
+            size: Icon size in points
+        """
+        corner_radius = self.ICON_CORNER_RADIUS
+        rendered = cached_icon(icon_path, size, corner_radius)
+        if rendered is not None:
+            icon_layer.setContents_(rendered)
+            return
 
-        return -1
+        icon_layer.setBackgroundColor_(ICON_PLACEHOLDER_COLOR)
+        icon_layer.setCornerRadius_(corner_radius)
 
-    def loadIcon_(self, icon_path):
-        """
-        Load an icon from the specified path and cache it.
+        def show_icon(rendered):
+            Quartz.CATransaction.begin()
+            Quartz.CATransaction.setDisableActions_(True)
+            icon_layer.setBackgroundColor_(None)
+            icon_layer.setContents_(rendered)
+            Quartz.CATransaction.commit()
 
-        Args:
-            icon_path: Path to the icon file (PNG, JPEG, WebP)
+        def decode_icon():
+            rendered = load_icon(icon_path, size, corner_radius)
+            if rendered is not None:
+                Cocoa.NSOperationQueue.mainQueue().addOperationWithBlock_(lambda: show_icon(rendered))
 
-        Returns:
-            NSImage object or None if loading fails
-        """
-        # Check cache first
-        if icon_path in self.icon_cache:
-            return self.icon_cache[icon_path]
-
-        # Try to load the icon
-        try:
-            icon = Cocoa.NSImage.alloc().initWithContentsOfFile_(icon_path)
-            if icon:
-                # Resize to 30x30 for left menu
-                icon.setSize_(Cocoa.NSMakeSize(30, 30))
-                self.icon_cache[icon_path] = icon
-                return icon
-        except Exception as e:
-            print(f"Error loading icon {icon_path}: {e}")
-
-        return None
+        _icon_queue.addOperationWithBlock_(decode_icon)
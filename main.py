@@ -4,14 +4,59 @@ Handy App - Quick Menu Launcher
 Main entry point for the application.
 """
 
+import os
 import sys
+import logging
+import importlib
 import objc
 import Cocoa
 from PyObjCTools import AppHelper
-from hotkey_listener import HotkeyListener
+import icon_helper
+import hotkey_listener
+import actions
+import menu_ui
+import pie_menu_view
+import secondary_menu_view
+import left_menu_view
+import view_helper
 from menu_ui import MenuUI
 
 
+log = logging.getLogger("handy.main")
+
+
+# Modules reloaded on a soft restart
+RELOADABLE_MODULES = (icon_helper, hotkey_listener)
+
+# Modules defining Objective-C classes, which PyObjC won't re-register, so a
+# soft restart can't reload them, plus view_helper, whose functions those
+# classes import by name. If any has been edited since launch, a restart
+# relaunches the interpreter instead.
+OBJC_MODULES = (actions, menu_ui, pie_menu_view, secondary_menu_view, left_menu_view, view_helper)
+
+
+def module_mtimes(modules):
+    """
+    Get the modification time of each module's source file.
+
+    Args:
+        modules: Imported modules
+
+    Returns:
+        Dictionary of module name to mtime (None if the file can't be read)
+    """
+    mtimes = {}
+    for module in modules:
+        try:
+            mtimes[module.__name__] = os.path.getmtime(module.__file__)
+        except OSError:
+            mtimes[module.__name__] = None
+    return mtimes
+
+
+LAUNCH_MTIMES = module_mtimes(OBJC_MODULES)
+
+
 class AppDelegate(Cocoa.NSObject):
     """Application delegate to handle app lifecycle."""
 
@@ -30,17 +75,65 @@ class AppDelegate(Cocoa.NSObject):
         print("Starting Handy App...")
         print("Press the mouse wheel button to open the quick menu.")
         print("Press Ctrl+C in terminal to quit.\n")
+        self.bootstrap()
 
+    def bootstrap(self):
+        """Create the menu UI and start the hotkey listener (on main thread)."""
         # Create menu UI instance (on main thread)
         self.menu_ui = MenuUI()
 
         # Create and start hotkey listener
-        self.listener = HotkeyListener(self.menu_ui)
+        self.listener = hotkey_listener.HotkeyListener(self.menu_ui)
         self.listener.start()
 
+    def soft_restart(self):
+        """
+        Restart Handy in-process: tear down the listener and menu UI, reload
+        the plain Python modules and bootstrap again, without relaunching the
+        interpreter. Relaunches instead if a reload fails or a module that
+        can't be reloaded has changed since launch.
+        """
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+        if self.menu_ui:
+            self.menu_ui.teardown()
+            self.menu_ui = None
+
+        changed = [
+            name for name, mtime in module_mtimes(OBJC_MODULES).items()
+            if mtime != LAUNCH_MTIMES[name]
+        ]
+        if changed:
+            log.info(f"{', '.join(changed)} changed since launch - relaunching")
+            self.relaunch()
+
+        # Reloading icon_helper also rescans the icons directory
+        try:
+            for module in RELOADABLE_MODULES:
+                importlib.reload(module)
+        except Exception as e:
+            log.warning(f"Reload failed ({e}) - relaunching")
+            self.relaunch()
+
+        self.bootstrap()
+        log.info(f"Handy restarted (reloaded {', '.join(m.__name__ for m in RELOADABLE_MODULES)})")
+
+    def relaunch(self):
+        """Replace this process with a fresh interpreter running Handy."""
+        python = sys.executable
+        os.execl(python, python, *sys.argv)
+
 
 def main():
     """Initialize and start the application."""
+    # Action logging is quiet by default; set HANDY_LOG=DEBUG to see every action
+    level = os.environ.get('HANDY_LOG', 'WARNING').upper()
+    if not isinstance(logging.getLevelName(level), int):
+        print(f"Unknown HANDY_LOG level '{level}' - using WARNING")
+        level = 'WARNING'
+    logging.basicConfig(level=level, format='%(message)s')
+
     # Create the app
     app = Cocoa.NSApplication.sharedApplication()
 
@@ -51,6 +144,9 @@ def main():
     # Set activation policy to accessory (no dock icon)
     app.setActivationPolicy_(Cocoa.NSApplicationActivationPolicyAccessory)
 
+    # Menu views only care about the latest pointer position
+    Cocoa.NSEvent.setMouseCoalescingEnabled_(True)
+
     # Run the app
     AppHelper.runEventLoop()
 
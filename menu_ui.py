@@ -3,11 +3,147 @@ Menu UI Module
 Handles the popup pie menu display and interaction.
 """
 
+import threading
+import collections
 import objc
 import Cocoa
+import libdispatch
 from actions import Actions
+import pie_menu_view
+import secondary_menu_view
 from pie_menu_view import PieMenuView
-from icon_helper import icon_path
+from secondary_menu_view import SecondaryMenuView
+from left_menu_view import LeftMenuView
+from icon_helper import icon_path, load_icon
+
+
+# Menu definitions: (title, action selector, icon file, extra item keys)
+# Icons are loaded from the icons/ directory
+
+# Left menu items (app shortcuts)
+LEFT_MENU = (
+    ('Pastebot', 'performPastebot:', 'pastebot.png', {}),
+    ('Notion', 'activateApp:', 'notion.png', {'app_path': '/Applications/Notion.app'}),
+    ('Dia', 'activateApp:', 'dia.png', {'app_path': '/Applications/Dia.app'}),
+    ('VS Code', 'activateApp:', 'vscode.png', {'app_path': '/Applications/Visual Studio Code - Insiders.app'}),
+    ('Alfred', 'performAlfred:', 'alfred.png', {}),
+)
+
+# Pie menu items (frequently used). Pie starts at top and goes clockwise
+PIE_MENU = (
+    ('Copy', 'performCopy:', 'copy.png', {}),
+    ('Paste', 'performPaste:', 'paste.png', {}),
+    ('Paste Plain', 'performPastePlain:', 'paste-plain.png', {}),
+    ('Save', 'performSave:', 'save.png', {}),
+    ('Find', 'performFind:', 'find.png', {}),
+    ('Switch Window', 'performSwitchWindow:', 'switch-window.png', {}),
+    ('Undo', 'performUndo:', 'undo.png', {}),
+    ('Tab', 'performTab:', 'tab.png', {}),
+    ('Escape', 'performEscape:', 'escape.png', {}),
+    ('Dictation', 'performDictation:', 'dictation.png', {}),
+)
+
+# Secondary menu items (less frequently used)
+SECONDARY_MENU = (
+    ('PixelSnap', 'performPixelSnap:', 'pixelsnap.png', {}),
+    ('ColorSlurp', 'performColorSlurp:', 'colorslurp.png', {}),
+    ('Screenshot', 'performScreenCapture:', 'screenshot.png', {}),
+    ('Select All', 'performSelectAll:', 'select-all.png', {}),
+    ('Select All & Copy', 'performSelectAllCopy:', 'select-all-copy.png', {}),
+    ('Paste Captured', 'performCopyAndPaste:', 'paste.png', {}),
+    ('Deselect', 'performDeselect:', 'deselect.png', {}),
+    ('Restart Handy', 'performRestart:', 'restart.png', {}),
+)
+
+
+# A menu item as the views take it. icon is an absolute path (or None if the
+# file is missing); app_path is only set for activateApp: items. Selecting the
+# item calls handler(argument).
+MenuItem = collections.namedtuple('MenuItem', 'title action target icon app_path handler argument')
+
+
+def secondary_menu_height(num_items):
+    """
+    Compute the height of the secondary menu grid.
+
+    Args:
+        num_items: Number of secondary menu items
+
+    Returns:
+        Height in points
+    """
+    # Same parameters the view lays its grid out with
+    view = SecondaryMenuView
+    num_columns = min(num_items, view.MAX_COLUMNS)
+    num_rows = (num_items + num_columns - 1) // num_columns
+    button_height = (
+        (view.VERTICAL_BUTTON_PADDING * 2) + secondary_menu_view.ICON_SIZE + view.ICON_TEXT_SPACING + view.TEXT_HEIGHT
+    )
+    button_spacing = view.BUTTON_SPACING
+    return (num_rows * button_height) + ((num_rows + 1) * button_spacing)
+
+
+# Window layout. The menus never change while running, so it's fixed at import
+MENU_SIZE = 420  # Pie menu size
+LEFT_MENU_WIDTH = 60  # Width for left menu
+MENU_GAP = 10  # Gap between menus
+SECONDARY_MENU_HEIGHT = secondary_menu_height(len(SECONDARY_MENU))
+WINDOW_WIDTH = LEFT_MENU_WIDTH + MENU_GAP + MENU_SIZE
+WINDOW_HEIGHT = MENU_SIZE + SECONDARY_MENU_HEIGHT + MENU_GAP
+
+
+def build_menu_items(menu, target):
+    """
+    Build the items the menu views take from a menu definition.
+
+    Args:
+        menu: Tuple of (title, action, icon file, extra keys)
+        target: Object that receives the actions
+
+    Returns:
+        List of MenuItem tuples
+    """
+    items = []
+    for title, action, icon, extra in menu:
+        app_path = extra.get('app_path')
+        items.append(MenuItem(
+            title, action, target, icon_path(icon), app_path,
+            # Bound method for the selector, resolved once rather than per click
+            handler=getattr(target, action.replace(':', '_')),
+            argument={'path': app_path} if app_path else None,
+        ))
+    return items
+
+
+def preload_icons(items, size, corner_radius):
+    """
+    Decode menu item icons ahead of time so the first show doesn't have to.
+
+    Args:
+        items: List of MenuItem tuples from build_menu_items
+        size: Icon size in points used by the view that shows them
+        corner_radius: Icon corner radius used by that view
+    """
+    for item in items:
+        if item.icon:
+            load_icon(item.icon, size, corner_radius)
+
+
+def primary_screen_height():
+    """
+    Get the height of the primary display, the one global coordinates are
+    measured from (CGEvent's top-left origin, Cocoa's bottom-left origin).
+
+    Returns:
+        Height in points
+    """
+    screens = Cocoa.NSScreen.screens()
+    screen = screens[0] if screens else Cocoa.NSScreen.mainScreen()
+    return screen.frame().size.height
+
+
+# A point outside every menu view, used to clear hover state
+OUTSIDE_POINT = Cocoa.NSMakePoint(-10000, -10000)
 
 
 class MenuUI(Cocoa.NSObject):
@@ -20,163 +156,167 @@ class MenuUI(Cocoa.NSObject):
             return None
 
         self.actions = Actions.alloc().init()
-        self.menu_window = None
+        self.menu_window = None  # Created on first show, then reused
+        self.menu_views = ()
         self.captured_text = None
+
+        # Latest hover position from the listener thread; at most one update
+        # is queued on the main thread at a time
+        self.hover_lock = threading.Lock()
+        self.pending_hover = None
+        self.hover_scheduled = False
+
+        # Track the frontmost app as it changes, so showing the menu doesn't
+        # have to ask the workspace for it
+        workspace = Cocoa.NSWorkspace.sharedWorkspace()
+        self.frontmost_app = workspace.frontmostApplication()
+        self.app_activation_observer = workspace.notificationCenter().addObserverForName_object_queue_usingBlock_(
+            Cocoa.NSWorkspaceDidActivateApplicationNotification,
+            None,
+            Cocoa.NSOperationQueue.mainQueue(),
+            self.app_did_activate
+        )
+
+        # Height of the primary display, for flipping CGEvent coordinates.
+        # Kept current as displays are added, removed or rearranged.
+        self.screen_height = primary_screen_height()
+        self.screen_observer = Cocoa.NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+            Cocoa.NSApplicationDidChangeScreenParametersNotification,
+            None,
+            Cocoa.NSOperationQueue.mainQueue(),
+            self.screen_parameters_did_change
+        )
+
+        # Menu contents never change while running, so build them once
+        self.left_menu_items = build_menu_items(LEFT_MENU, self.actions)
+        self.pie_menu_items = build_menu_items(PIE_MENU, self.actions)
+        self.secondary_items = build_menu_items(SECONDARY_MENU, self.actions)
+
+        # Decode the icons now rather than while drawing the first popup
+        preload_icons(self.left_menu_items, LeftMenuView.ICON_SIZE, LeftMenuView.ICON_CORNER_RADIUS)
+        preload_icons(self.pie_menu_items, pie_menu_view.ICON_SIZE, pie_menu_view.ICON_CORNER_RADIUS)
+        if icon_path('handy.png'):
+            center_icon_size = pie_menu_view.CENTER_ICON_SIZE
+            load_icon(icon_path('handy.png'), center_icon_size, center_icon_size / 2)
+        preload_icons(self.secondary_items, secondary_menu_view.ICON_SIZE, secondary_menu_view.ICON_CORNER_RADIUS)
         return self
 
+    def app_did_activate(self, notification):
+        """
+        Remember the newly activated app (on the main thread). Handy itself
+        activates whenever the menu shows, so it's never recorded.
+
+        Args:
+            notification: NSWorkspaceDidActivateApplicationNotification
+        """
+        app = notification.userInfo()[Cocoa.NSWorkspaceApplicationKey]
+        if app and app != Cocoa.NSRunningApplication.currentApplication():
+            self.frontmost_app = app
+
+    def screen_parameters_did_change(self, notification):
+        """
+        Refresh the cached screen height after a display change (on the main thread).
+
+        Args:
+            notification: NSApplicationDidChangeScreenParametersNotification
+        """
+        self.screen_height = primary_screen_height()
+
     def set_captured_text(self, text):
         """Store captured text for later use by Copy action."""
         self.captured_text = text
         self.actions.set_captured_text(text)
 
-    def showMenuAtLocation_(self, location_dict):
+    def showMenuAtX_y_(self, x, y):
         """
         Display the pie menu at the specified coordinates.
         This method is called on the main thread.
 
         Args:
-            location_dict: Dictionary with 'x' and 'y' keys for coordinates
+            x: X coordinate for menu position
+            y: Y coordinate for menu position
         """
-        x = location_dict['x']
-        y = location_dict['y']
-
-        # Close any existing menu window first
+        # Hide the menu if it's already showing (the window itself is reused)
         if self.menu_window and self.menu_window.isVisible():
             self.menu_window.orderOut_(None)
-        self.menu_window = None
 
         # Remember the currently active app so we can return focus to it
-        workspace = Cocoa.NSWorkspace.sharedWorkspace()
-        active_app = workspace.frontmostApplication()
-        if active_app:
-            self.actions.setPreviousApp_(active_app)
-
-        # Define left menu items (app shortcuts)
-        left_menu_items = [
-            {'title': 'Pastebot', 'action': 'performPastebot:', 'target': self.actions, 'icon': icon_path('pastebot.png')},
-            {'title': 'Notion', 'action': 'activateApp:', 'target': self.actions, 'app_path': '/Applications/Notion.app', 'icon': icon_path('notion.png')},
-            {'title': 'Dia', 'action': 'activateApp:', 'target': self.actions, 'app_path': '/Applications/Dia.app', 'icon': icon_path('dia.png')},
-            {'title': 'VS Code', 'action': 'activateApp:', 'target': self.actions, 'app_path': '/Applications/Visual Studio Code - Insiders.app', 'icon': icon_path('vscode.png')},
-            {'title': 'Alfred', 'action': 'performAlfred:', 'target': self.actions, 'icon': icon_path('alfred.png')},
-        ]
-
-        # Define menu items for pie menu (frequently used)
-        # Icons are loaded from the icons/ directory
-        # Add PNG files to icons/ and they'll be automatically found
-        # Pie starts at top and goes clockwise
-        menu_items = [
-            {'title': 'Copy', 'action': 'performCopy:', 'target': self.actions, 'icon': icon_path('copy.png')},
-            {'title': 'Paste', 'action': 'performPaste:', 'target': self.actions, 'icon': icon_path('paste.png')},
-            {'title': 'Paste Plain', 'action': 'performPastePlain:', 'target': self.actions, 'icon': icon_path('paste-plain.png')},
-            {'title': 'Save', 'action': 'performSave:', 'target': self.actions, 'icon': icon_path('save.png')},
-            {'title': 'Find', 'action': 'performFind:', 'target': self.actions, 'icon': icon_path('find.png')},
-            {'title': 'Switch Window', 'action': 'performSwitchWindow:', 'target': self.actions, 'icon': icon_path('switch-window.png')},
-            {'title': 'Undo', 'action': 'performUndo:', 'target': self.actions, 'icon': icon_path('undo.png')},
-            {'title': 'Tab', 'action': 'performTab:', 'target': self.actions, 'icon': icon_path('tab.png')},
-            {'title': 'Escape', 'action': 'performEscape:', 'target': self.actions, 'icon': icon_path('escape.png')},
-            {'title': 'Dictation', 'action': 'performDictation:', 'target': self.actions, 'icon': icon_path('dictation.png')},
-        ]
-
-        # Define secondary menu items (less frequently used)
-        secondary_items = [
-            {'title': 'PixelSnap', 'action': 'performPixelSnap:', 'target': self.actions, 'icon': icon_path('pixelsnap.png')},
-            {'title': 'ColorSlurp', 'action': 'performColorSlurp:', 'target': self.actions, 'icon': icon_path('colorslurp.png')},
-            {'title': 'Screenshot', 'action': 'performScreenCapture:', 'target': self.actions, 'icon': icon_path('screenshot.png')},
-            {'title': 'Select All', 'action': 'performSelectAll:', 'target': self.actions, 'icon': icon_path('select-all.png')},
-            {'title': 'Select All & Copy', 'action': 'performSelectAllCopy:', 'target': self.actions, 'icon': icon_path('select-all-copy.png')},
-            {'title': 'Deselect', 'action': 'performDeselect:', 'target': self.actions, 'icon': icon_path('deselect.png')},
-            {'title': 'Restart Handy', 'action': 'performRestart:', 'target': self.actions, 'icon': icon_path('restart.png')},
-        ]
-
-        # === SECONDARY MENU PARAMETERS (must match secondary_menu_view.py) ===
-        button_spacing = 8
-        vertical_button_padding = 6
-        icon_text_spacing = 4
-        icon_size = 30
-        text_height = 12
-        max_columns = 3
-        # ======================================================================
-
-        # Calculate secondary menu height dynamically
-        num_secondary_items = len(secondary_items)
-        num_columns = min(num_secondary_items, max_columns)
-        num_rows = (num_secondary_items + num_columns - 1) // num_columns
-        button_height = (vertical_button_padding * 2) + icon_size + icon_text_spacing + text_height
-        secondary_menu_height = (num_rows * button_height) + ((num_rows + 1) * button_spacing)
-
-        # Create window size
-        menu_size = 420  # Pie menu size
-        left_menu_width = 60  # Width for left menu
-        gap = 10  # Gap between menus
+        if self.frontmost_app:
+            self.actions.setPreviousApp_(self.frontmost_app)
 
         # Get screen height for coordinate conversion
         # macOS screen coords: origin at bottom-left, y increases upward
         # Window positioning: origin at top-left of screen, y increases downward
-        main_screen = Cocoa.NSScreen.mainScreen()
-        screen_frame = main_screen.frame()
-        screen_height = screen_frame.size.height
+        screen_height = self.screen_height
 
         # Convert from screen coordinates (bottom-left origin) to window position (top-left origin)
         # Center the menu on the cursor position
-        total_height = menu_size + secondary_menu_height + gap
-        total_width = left_menu_width + gap + menu_size
-        window_x = x - (left_menu_width + gap + menu_size / 2)
-        window_y = screen_height - y - menu_size / 2
+        window_x = x - (LEFT_MENU_WIDTH + MENU_GAP + MENU_SIZE / 2)
+        window_y = screen_height - y - MENU_SIZE / 2
 
         window_rect = Cocoa.NSMakeRect(
             window_x,
-            window_y - secondary_menu_height - gap,  # Shift up to account for secondary menu
-            total_width,
-            total_height
-        )        # Create a borderless, transparent window
-        style_mask = Cocoa.NSWindowStyleMaskBorderless
-        self.menu_window = Cocoa.NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-            window_rect,
-            style_mask,
-            Cocoa.NSBackingStoreBuffered,
-            False
+            window_y - SECONDARY_MENU_HEIGHT - MENU_GAP,  # Shift up to account for secondary menu
+            WINDOW_WIDTH,
+            WINDOW_HEIGHT
         )
 
-        # Configure window
-        self.menu_window.setOpaque_(False)
-        self.menu_window.setBackgroundColor_(Cocoa.NSColor.clearColor())
-        self.menu_window.setLevel_(Cocoa.NSFloatingWindowLevel)
-        self.menu_window.setHasShadow_(True)
-        self.menu_window.setIgnoresMouseEvents_(False)
-        self.menu_window.setAcceptsMouseMovedEvents_(True)
+        if self.menu_window is None:
+            # Create a borderless, transparent window
+            style_mask = Cocoa.NSWindowStyleMaskBorderless
+            self.menu_window = Cocoa.NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
+                window_rect,
+                style_mask,
+                Cocoa.NSBackingStoreBuffered,
+                False
+            )
 
-        # Create container view that holds all menus
-        from secondary_menu_view import SecondaryMenuView
-        from left_menu_view import LeftMenuView
+            # Configure window. It's kept across shows, so don't free it on close
+            self.menu_window.setReleasedWhenClosed_(False)
+            self.menu_window.setOpaque_(False)
+            self.menu_window.setBackgroundColor_(Cocoa.NSColor.clearColor())
+            self.menu_window.setLevel_(Cocoa.NSFloatingWindowLevel)
+            self.menu_window.setHasShadow_(True)
+            self.menu_window.setIgnoresMouseEvents_(False)
+            self.menu_window.setAcceptsMouseMovedEvents_(True)
+
+            # Create container view that holds all menus
+            container_view = Cocoa.NSView.alloc().initWithFrame_(
+                Cocoa.NSMakeRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+            )
 
-        container_view = Cocoa.NSView.alloc().initWithFrame_(
-            Cocoa.NSMakeRect(0, 0, total_width, total_height)
-        )
+            # Create pie menu view first (at the top)
+            pie_view = PieMenuView.alloc().initWithFrame_(
+                Cocoa.NSMakeRect(LEFT_MENU_WIDTH + MENU_GAP, SECONDARY_MENU_HEIGHT + MENU_GAP, MENU_SIZE, MENU_SIZE)
+            )
+            pie_view.setMenuItems_(self.pie_menu_items)
+            container_view.addSubview_(pie_view)
 
-        # Create pie menu view first (at the top)
-        pie_view = PieMenuView.alloc().initWithFrame_(
-            Cocoa.NSMakeRect(left_menu_width + gap, secondary_menu_height + gap, menu_size, menu_size)
-        )
-        pie_view.setMenuItems_(menu_items)
-        container_view.addSubview_(pie_view)
+            # Create and position left menu (vertical, same height as pie menu)
+            left_view = LeftMenuView.alloc().initWithFrame_(
+                Cocoa.NSMakeRect(0, SECONDARY_MENU_HEIGHT + MENU_GAP, LEFT_MENU_WIDTH, MENU_SIZE)
+            )
+            left_view.setMenuItems_(self.left_menu_items)
+            container_view.addSubview_(left_view)
 
-        # Create and position left menu (vertical, same height as pie menu)
-        left_view = LeftMenuView.alloc().initWithFrame_(
-            Cocoa.NSMakeRect(0, secondary_menu_height + gap, left_menu_width, menu_size)
-        )
-        left_view.setMenuItems_(left_menu_items)
-        container_view.addSubview_(left_view)
+            # Create and position secondary menu at the bottom (below pie menu, offset by left menu width)
+            # Y position is 0, which is at the bottom of the container
+            secondary_view = SecondaryMenuView.alloc().initWithFrame_(
+                Cocoa.NSMakeRect(LEFT_MENU_WIDTH + MENU_GAP, 0, MENU_SIZE, SECONDARY_MENU_HEIGHT)
+            )
+            secondary_view.setMenuItems_(self.secondary_items)
+            container_view.addSubview_(secondary_view)
 
-        # Create and position secondary menu at the bottom (below pie menu, offset by left menu width)
-        # Y position is 0, which is at the bottom of the container
-        secondary_view = SecondaryMenuView.alloc().initWithFrame_(
-            Cocoa.NSMakeRect(left_menu_width + gap, 0, menu_size, secondary_menu_height)
-        )
-        secondary_view.setMenuItems_(secondary_items)
-        container_view.addSubview_(secondary_view)
+            # Set container as window content
+            self.menu_window.setContentView_(container_view)
 
-        # Set container as window content
-        self.menu_window.setContentView_(container_view)
+            # Keep the views to reset their hover state on the next show
+            self.menu_views = (pie_view, left_view, secondary_view)
+        else:
+            # Reuse the window and views: just move it and clear stale hover
+            self.menu_window.setFrame_display_(window_rect, False)
+            for view in self.menu_views:
+                view.updateHoveredIndex_(OUTSIDE_POINT)
 
         # Show the window
         self.menu_window.makeKeyAndOrderFront_(None)
@@ -195,11 +335,9 @@ class MenuUI(Cocoa.NSObject):
             y: Y coordinate for menu position
         """
         # Schedule the menu to appear on the main thread
-        location_dict = {'x': x, 'y': y}
-        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "showMenuAtLocation:",
-            location_dict,
-            False
+        libdispatch.dispatch_async(
+            libdispatch.dispatch_get_main_queue(),
+            lambda: self.showMenuAtX_y_(x, y)
         )
 
     def close_menu(self):
@@ -207,19 +345,42 @@ class MenuUI(Cocoa.NSObject):
         Close the menu if it's currently visible.
         This can be called from any thread; it will execute on the main thread.
         """
-        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "closeMenuOnMainThread:",
-            None,
-            False
+        libdispatch.dispatch_async(
+            libdispatch.dispatch_get_main_queue(),
+            lambda: self.closeMenuOnMainThread_(None)
         )
 
     def closeMenuOnMainThread_(self, _):
         """
-        Close the menu window on the main thread.
+        Close the menu window on the main thread. The window is only hidden
+        so the next show can reuse it.
         """
         if self.menu_window and self.menu_window.isVisible():
             self.menu_window.orderOut_(None)
-            self.menu_window = None
+
+    def teardown(self):
+        """
+        Close the menu and release the actions handler before this instance is discarded.
+        Must be called on the main thread.
+        """
+        # Drop the reused window's views and backing store right away rather
+        # than whenever the last Python reference goes
+        if self.menu_window:
+            self.menu_window.orderOut_(None)
+            self.menu_window.setContentView_(None)
+            self.menu_window.close()
+        self.menu_window = None
+        self.menu_views = ()
+
+        # Stop tracking app activations and display changes
+        if self.app_activation_observer is not None:
+            Cocoa.NSWorkspace.sharedWorkspace().notificationCenter().removeObserver_(self.app_activation_observer)
+            self.app_activation_observer = None
+        if self.screen_observer is not None:
+            Cocoa.NSNotificationCenter.defaultCenter().removeObserver_(self.screen_observer)
+            self.screen_observer = None
+
+        self.actions.teardown()
 
     def update_hover_at_position(self, x, y):
         """
@@ -230,45 +391,53 @@ class MenuUI(Cocoa.NSObject):
             x: X coordinate in screen space
             y: Y coordinate in screen space
         """
-        position_dict = {'x': x, 'y': y}
-        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "updateHoverAtPositionOnMainThread:",
-            position_dict,
-            False
+        # Fast drags produce far more events than the main thread can draw;
+        # only the latest position matters, so don't queue one call per event
+        with self.hover_lock:
+            self.pending_hover = (x, y)
+            if self.hover_scheduled:
+                return
+            self.hover_scheduled = True
+
+        libdispatch.dispatch_async(
+            libdispatch.dispatch_get_main_queue(),
+            self.flush_hover_update
         )
 
+    def flush_hover_update(self):
+        """Apply the latest pending hover position (on the main thread)."""
+        with self.hover_lock:
+            x, y = self.pending_hover
+            self.pending_hover = None
+            self.hover_scheduled = False
+
+        self.updateHoverAtX_y_(x, y)
+
     def trigger_item_at_cursor(self):
         """
         Trigger the menu item currently under the cursor.
         This can be called from any thread; it will execute on the main thread.
         """
-        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "triggerItemAtCursorOnMainThread:",
-            None,
-            False
+        libdispatch.dispatch_async(
+            libdispatch.dispatch_get_main_queue(),
+            lambda: self.triggerItemAtCursorOnMainThread_(None)
         )
 
-    def updateHoverAtPositionOnMainThread_(self, position_dict):
+    def updateHoverAtX_y_(self, x, y):
         """
         Update hover state at the given screen position on the main thread.
 
         Args:
-            position_dict: Dictionary with 'x' and 'y' keys for screen coordinates
+            x: X coordinate in screen space
+            y: Y coordinate in screen space
         """
         if not self.menu_window or not self.menu_window.isVisible():
             return
 
-        x = position_dict['x']
-        y = position_dict['y']
-
-        # Convert from screen coordinates (pynput uses top-left origin)
+        # Convert from screen coordinates (CGEvent locations use top-left origin)
         # to Cocoa screen coordinates (bottom-left origin)
-        main_screen = Cocoa.NSScreen.mainScreen()
-        screen_frame = main_screen.frame()
-        screen_height = screen_frame.size.height
-
         # Create NSPoint in Cocoa screen coordinates
-        mouse_location = Cocoa.NSMakePoint(x, screen_height - y)
+        mouse_location = Cocoa.NSMakePoint(x, self.screen_height - y)
 
         # Convert to window coordinates
         window_point = self.menu_window.convertPointFromScreen_(mouse_location)
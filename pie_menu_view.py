@@ -5,11 +5,32 @@ Creates a circular pie menu with radial slices for actions.
 
 import objc
 import Cocoa
+import Quartz
 import math
+from icon_helper import icon_path, load_icon
+from view_helper import backing_scale, run_menu_item, set_hover_fill
+
+
+# Slice and center circle colors
+FILL_COLOR = Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.2, 0.2, 0.2, 0.85).CGColor()
+HOVER_FILL_COLOR = Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.35, 0.35, 0.35, 0.9).CGColor()
+CENTER_FILL_COLOR = Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.15, 0.15, 0.15, 0.9).CGColor()
+BORDER_COLOR = Cocoa.NSColor.colorWithCalibratedWhite_alpha_(0.9, 0.5).CGColor()
+
+# Slice title text: 11 pt white
+TITLE_ATTRIBUTES = {
+    Cocoa.NSFontAttributeName: Cocoa.NSFont.systemFontOfSize_(11),
+    Cocoa.NSForegroundColorAttributeName: Cocoa.NSColor.whiteColor(),
+}
+
+# Icon sizes in points: slice icons, and the logo filling the center circle
+ICON_SIZE = 40
+CENTER_ICON_SIZE = 35 * 1.9
+ICON_CORNER_RADIUS = 8  # Adjust this value for more/less rounding
 
 
 class PieMenuView(Cocoa.NSView):
-    """Custom view that draws and handles a circular pie menu."""
+    """Custom layer-backed view that shows and handles a circular pie menu."""
 
     def initWithFrame_(self, frame):
         """Initialize the pie menu view."""
@@ -21,11 +42,30 @@ class PieMenuView(Cocoa.NSView):
         self.hovered_index = -1
         self.radius = 200  # Increased from 160 to accommodate icons
         self.center_radius = 35
-        self.icon_cache = {}  # Cache loaded icons
+
+        # Hit-testing constants: the frame never changes, so neither does the center
+        self.center_x = frame.size.width / 2
+        self.center_y = frame.size.height / 2
+        self.radius_squared = self.radius * self.radius
+        self.inner_radius_squared = (self.center_radius / 2) ** 2
+        self.slices_per_radian = 0.0  # Set with the menu items
+
+        self.slice_layers = []  # Slice shape layers, by menu item index
+        self.layer_scale = 1.0  # Backing scale the layers were built for
+        self.last_hover_point = None  # Point the hovered index was last computed for
+
+        # Logo shown in the center circle, loaded once
+        handy_icon_path = icon_path('handy.png')
+        self.handy_icon = load_icon(handy_icon_path, CENTER_ICON_SIZE, CENTER_ICON_SIZE / 2) if handy_icon_path else None
 
         # Set up tracking area for mouse hover
         self.tracking_area = None
 
+        self.setWantsLayer_(True)
+        # Everything is drawn by sublayers, so AppKit never needs to redraw
+        # the view's own layer
+        self.setLayerContentsRedrawPolicy_(Cocoa.NSViewLayerContentsRedrawNever)
+
         return self
 
     def updateTrackingAreas(self):
@@ -60,65 +100,53 @@ class PieMenuView(Cocoa.NSView):
         Set the menu items to display.
 
         Args:
-            items: List of dictionaries with 'title', 'action', and 'target'
+            items: List of MenuItem tuples (see menu_ui)
         """
         self.menu_items = items
-        self.setNeedsDisplay_(True)
+        self.slices_per_radian = len(items) / (2 * math.pi)
+        self.last_hover_point = None
+        self.buildSliceLayers()
 
-    def drawRect_(self, rect):
+    def buildSliceLayers(self):
         """
-        Draw the pie menu.
-
-        Args:
-            rect: The rectangle to draw in
+        Build one layer tree per slice: a wedge shape layer with an icon layer
+        and a text layer on top, then the center circle with the Handy logo.
+        Hovering then only swaps a shape layer's fill color, so the view never
+        has to redraw.
         """
-        if not self.menu_items:
+        self.layer().setSublayers_(None)
+        num_items = len(self.menu_items)
+        self.slice_layers = [None] * num_items
+        self.layer_scale = self.backingScale()
+        if num_items == 0:
             return
 
-        # Get the graphics context
-        context = Cocoa.NSGraphicsContext.currentContext().CGContext()
-
-        # Calculate center point
         bounds = self.bounds()
-        center_x = bounds.size.width / 2
-        center_y = bounds.size.height / 2
-
-        # Number of slices
-        num_items = len(self.menu_items)
+        center_x = self.center_x
+        center_y = self.center_y
         angle_per_slice = 2 * math.pi / num_items
-        # Draw each pie slice starting at top, going clockwise
-        # Rotate the menu items so first item is at top instead of bottom
-        rotated_items = self.menu_items[num_items//2:] + self.menu_items[:num_items//2]
-        for i, item in enumerate(rotated_items):
-            start_angle = -math.pi / 2 - i * angle_per_slice
+        scale = self.layer_scale
+
+        # Add slices starting at top, going clockwise. The items are rotated
+        # so the first item is at top instead of bottom.
+        for visual_index in range(num_items):
+            index = (visual_index + num_items // 2) % num_items
+            item = self.menu_items[index]
+            start_angle = -math.pi / 2 - visual_index * angle_per_slice
             end_angle = start_angle - angle_per_slice
 
             # Create pie slice path
-            path = Cocoa.NSBezierPath.bezierPath()
-            path.moveToPoint_(Cocoa.NSMakePoint(center_x, center_y))
-            path.appendBezierPathWithArcWithCenter_radius_startAngle_endAngle_clockwise_(
-                Cocoa.NSMakePoint(center_x, center_y),
-                self.radius,
-                math.degrees(start_angle),
-                math.degrees(end_angle),
-                True
-            )
-            path.closePath()
-
-            # Fill color - highlight if hovered
-            # i is visual index, convert to array index for comparison
-            array_index = (i + num_items // 2) % num_items
-            if array_index == self.hovered_index:
-                Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.35, 0.35, 0.35, 0.9).setFill()
-            else:
-                Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.2, 0.2, 0.2, 0.85).setFill()
-
-            path.fill()
-
-            # Draw border
-            Cocoa.NSColor.colorWithCalibratedWhite_alpha_(0.9, 0.5).setStroke()
-            path.setLineWidth_(1.5)
-            path.stroke()
+            path = Quartz.CGPathCreateMutable()
+            Quartz.CGPathMoveToPoint(path, None, center_x, center_y)
+            Quartz.CGPathAddArc(path, None, center_x, center_y, self.radius, start_angle, end_angle, True)
+            Quartz.CGPathCloseSubpath(path)
+
+            slice_layer = Quartz.CAShapeLayer.layer()
+            slice_layer.setFrame_(bounds)
+            slice_layer.setPath_(path)
+            slice_layer.setFillColor_(FILL_COLOR)
+            slice_layer.setStrokeColor_(BORDER_COLOR)
+            slice_layer.setLineWidth_(1.5)
 
             # Calculate position for icon and text
             mid_angle = start_angle - angle_per_slice / 2
@@ -126,119 +154,101 @@ class PieMenuView(Cocoa.NSView):
             content_x = center_x + content_radius * math.cos(mid_angle)
             content_y = center_y + content_radius * math.sin(mid_angle)
 
-            # Draw icon if available
-            icon_size = 40
-            if 'icon' in item and item['icon']:
-                icon = self.loadIcon_(item['icon'])
-                if icon:
-                    icon_rect = Cocoa.NSMakeRect(
-                        content_x - icon_size / 2,
-                        content_y - icon_size / 2 + 10,  # Offset up from center
-                        icon_size,
-                        icon_size
-                    )
-
-                    # Save graphics state
-                    Cocoa.NSGraphicsContext.currentContext().saveGraphicsState()
-
-                    # Create rounded rectangle clipping path for icon
-                    icon_corner_radius = 8  # Adjust this value for more/less rounding
-                    icon_clip_path = Cocoa.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-                        icon_rect,
-                        icon_corner_radius,
-                        icon_corner_radius
-                    )
-                    icon_clip_path.addClip()
-
-                    # Draw the icon within the rounded rectangle
-                    icon.drawInRect_fromRect_operation_fraction_(
-                        icon_rect,
-                        Cocoa.NSZeroRect,
-                        Cocoa.NSCompositeSourceOver,
-                        1.0
-                    )
-
-                    # Restore graphics state
-                    Cocoa.NSGraphicsContext.currentContext().restoreGraphicsState()
-
-            # Create text attributes
-            attributes = {
-                Cocoa.NSFontAttributeName: Cocoa.NSFont.systemFontOfSize_(11),
-                Cocoa.NSForegroundColorAttributeName: Cocoa.NSColor.whiteColor()
-            }
-
-            # Draw the title below the icon
-            title = Cocoa.NSString.stringWithString_(item['title'])
-            text_size = title.sizeWithAttributes_(attributes)
-            text_y_offset = -20 if 'icon' in item and item['icon'] else 0
-            text_rect = Cocoa.NSMakeRect(
+            # Icon, offset up from center (prerendered with rounded corners)
+            icon_size = ICON_SIZE
+            icon = self.loadIcon_(item.icon) if item.icon else None
+            if icon:
+                icon_layer = Quartz.CALayer.layer()
+                icon_layer.setFrame_(Quartz.CGRectMake(
+                    content_x - icon_size / 2,
+                    content_y - icon_size / 2 + 10,
+                    icon_size,
+                    icon_size
+                ))
+                icon_layer.setContents_(icon)
+                icon_layer.setContentsScale_(scale)
+                slice_layer.addSublayer_(icon_layer)
+
+            # Title below the icon
+            title = Cocoa.NSAttributedString.alloc().initWithString_attributes_(item.title, TITLE_ATTRIBUTES)
+            text_size = title.size()
+            text_y_offset = -20 if item.icon else 0
+            title_layer = Quartz.CATextLayer.layer()
+            title_layer.setFrame_(Quartz.CGRectMake(
                 content_x - text_size.width / 2,
                 content_y - text_size.height / 2 + text_y_offset,
                 text_size.width,
                 text_size.height
-            )
-            title.drawInRect_withAttributes_(text_rect, attributes)
-
-        # Draw center circle
-        center_path = Cocoa.NSBezierPath.bezierPathWithOvalInRect_(
-            Cocoa.NSMakeRect(
+            ))
+            title_layer.setString_(title)
+            title_layer.setContentsScale_(scale)
+            slice_layer.addSublayer_(title_layer)
+
+            self.layer().addSublayer_(slice_layer)
+            self.slice_layers[index] = slice_layer
+
+        # Center circle
+        center_layer = Quartz.CAShapeLayer.layer()
+        center_layer.setFrame_(bounds)
+        center_layer.setPath_(Quartz.CGPathCreateWithEllipseInRect(
+            Quartz.CGRectMake(
                 center_x - self.center_radius,
                 center_y - self.center_radius,
                 self.center_radius * 2,
                 self.center_radius * 2
-            )
-        )
-        Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.15, 0.15, 0.15, 0.9).setFill()
-        center_path.fill()
-        Cocoa.NSColor.colorWithCalibratedWhite_alpha_(0.9, 0.5).setStroke()
-        center_path.setLineWidth_(1.5)
-        center_path.stroke()
-
-        # Draw handy logo in center
-        from icon_helper import icon_path
-        handy_icon_path = icon_path('handy.png')
-        if handy_icon_path:
-            handy_icon = self.loadIcon_(handy_icon_path)
-            if handy_icon:
-                # Make icon fill the center circle
-                center_icon_size = self.center_radius * 1.9
-                center_icon_rect = Cocoa.NSMakeRect(
-                    center_x - center_icon_size / 2,
-                    center_y - center_icon_size / 2,
-                    center_icon_size,
-                    center_icon_size
-                )
-
-                # Save graphics state
-                Cocoa.NSGraphicsContext.currentContext().saveGraphicsState()
-
-                # Clip to circle for rounded icon
-                center_clip_path = Cocoa.NSBezierPath.bezierPathWithOvalInRect_(center_icon_rect)
-                center_clip_path.addClip()
-
-                # Draw the icon
-                handy_icon.drawInRect_fromRect_operation_fraction_(
-                    center_icon_rect,
-                    Cocoa.NSZeroRect,
-                    Cocoa.NSCompositeSourceOver,
-                    1.0
-                )
-
-                # Restore graphics state
-                Cocoa.NSGraphicsContext.currentContext().restoreGraphicsState()
+            ),
+            None
+        ))
+        center_layer.setFillColor_(CENTER_FILL_COLOR)
+        center_layer.setStrokeColor_(BORDER_COLOR)
+        center_layer.setLineWidth_(1.5)
+
+        # Handy logo filling the center circle, prerendered round
+        handy_icon = self.handy_icon
+        if handy_icon:
+            center_icon_size = CENTER_ICON_SIZE
+            handy_layer = Quartz.CALayer.layer()
+            handy_layer.setFrame_(Quartz.CGRectMake(
+                center_x - center_icon_size / 2,
+                center_y - center_icon_size / 2,
+                center_icon_size,
+                center_icon_size
+            ))
+            handy_layer.setContents_(handy_icon)
+            handy_layer.setContentsScale_(scale)
+            center_layer.addSublayer_(handy_layer)
+
+        self.layer().addSublayer_(center_layer)
+
+        if 0 <= self.hovered_index < num_items:
+            self.slice_layers[self.hovered_index].setFillColor_(HOVER_FILL_COLOR)
+
+    def backingScale(self):
+        """Return the backing scale factor for crisp text on Retina displays."""
+        return backing_scale(self)
+
+    def viewDidChangeBackingProperties(self):
+        """Rebuild the slices at the new scale when the view changes display."""
+        objc.super(PieMenuView, self).viewDidChangeBackingProperties()
+        if self.backingScale() != self.layer_scale:
+            self.buildSliceLayers()
 
     def mouseMoved_(self, event):
         """Handle mouse movement for hover effect."""
         point = self.convertPoint_fromView_(event.locationInWindow(), None)
-        index = self.getSliceIndexAtPoint_(point)
+        self.updateHoveredIndex_(point)
 
         # Update cursor based on whether we're over a slice
-        if index >= 0:
+        if self.hovered_index >= 0:
             Cocoa.NSCursor.pointingHandCursor().set()
         else:
             Cocoa.NSCursor.arrowCursor().set()
 
-        self.updateHoveredIndex_(point)
+    def mouseExited_(self, event):
+        """Clear the hover when the pointer leaves the view."""
+        self.last_hover_point = None
+        self.setHoveredIndex_(-1)
+        Cocoa.NSCursor.arrowCursor().set()
 
     def mouseDragged_(self, event):
         """Handle left mouse button drag."""
@@ -258,34 +268,30 @@ class PieMenuView(Cocoa.NSView):
         index = self.getSliceIndexAtPoint_(point)
 
         if index >= 0 and index < len(self.menu_items):
-            item = self.menu_items[index]
-            target = item['target']
-            action = item['action']
-
-            # Call the action
-            if target and action:
-                try:
-                    # Check if this action needs an app_path parameter
-                    if 'app_path' in item:
-                        # Pass app path as a dictionary
-                        target.performSelector_withObject_(action, {'path': item['app_path']})
-                    else:
-                        # PyObjC automatically handles selector conversion
-                        target.performSelector_withObject_(action, None)
-                except Exception as e:
-                    print(f"Error calling action {action}: {e}")
-
-            # Close the menu by hiding it
-            window = self.window()
-            if window:
-                window.orderOut_(None)
+            run_menu_item(self, self.menu_items[index])
 
     def updateHoveredIndex_(self, point):
         """Update which slice is being hovered."""
-        new_index = self.getSliceIndexAtPoint_(point)
+        # Sub-pixel jitter can't move the pointer to another slice
+        last_point = self.last_hover_point
+        if last_point is not None:
+            dx = point.x - last_point.x
+            dy = point.y - last_point.y
+            if dx * dx + dy * dy < 1.0:
+                return
+        self.last_hover_point = point
+        self.setHoveredIndex_(self.getSliceIndexAtPoint_(point))
+
+    def setHoveredIndex_(self, new_index):
+        """
+        Highlight a slice, un-highlighting the previous one.
+
+        Args:
+            new_index: Index of the slice to highlight, or -1 for none
+        """
         if new_index != self.hovered_index:
+            set_hover_fill(self.slice_layers, self.hovered_index, new_index, FILL_COLOR, HOVER_FILL_COLOR)
             self.hovered_index = new_index
-            self.setNeedsDisplay_(True)
 
     def getSliceIndexAtPoint_(self, point):
         """
@@ -297,17 +303,13 @@ class PieMenuView(Cocoa.NSView):
         Returns:
             Index of the slice, or -1 if not in any slice
         """
-        bounds = self.bounds()
-        center_x = bounds.size.width / 2
-        center_y = bounds.size.height / 2
-
-        # Calculate distance from center
-        dx = point.x - center_x
-        dy = point.y - center_y
-        distance = math.sqrt(dx * dx + dy * dy)
+        # Calculate squared distance from center (no sqrt needed to compare)
+        dx = point.x - self.center_x
+        dy = point.y - self.center_y
+        distance_squared = dx * dx + dy * dy
 
         # Check if outside the menu or in the inner half of center circle
-        if distance > self.radius or distance < self.center_radius / 2:
+        if distance_squared > self.radius_squared or distance_squared < self.inner_radius_squared:
             return -1
 
         # Calculate angle from center to point
@@ -315,11 +317,10 @@ class PieMenuView(Cocoa.NSView):
 
         # Match the rendering rotation
         num_items = len(self.menu_items)
-        angle_per_slice = 2 * math.pi / num_items
         adjusted_angle = (-angle - math.pi / 2) % (2 * math.pi)
 
         # Get visual slice index, then map back to array index
-        visual_index = int(adjusted_angle / angle_per_slice) % num_items
+        visual_index = int(adjusted_angle * self.slices_per_radian) % num_items
         # Reverse the rotation we applied in rendering
         slice_index = (visual_index - num_items // 2) % num_items
 
@@ -327,7 +328,7 @@ class PieMenuView(Cocoa.NSView):
 
     def loadIcon_(self, icon_path):
         """
-        Load an icon from the specified path and cache it.
+        Load an icon from the specified path (cached across views).
 
         Args:
             icon_path: Path to the icon file (PNG, JPEG, WebP)
@@ -335,19 +336,4 @@ class PieMenuView(Cocoa.NSView):
         Returns:
             NSImage object or None if loading fails
         """
-        # Check cache first
-        if icon_path in self.icon_cache:
-            return self.icon_cache[icon_path]
-
-        # Try to load the icon
-        try:
-            icon = Cocoa.NSImage.alloc().initWithContentsOfFile_(icon_path)
-            if icon:
-                # Resize to 40x40 if needed
-                icon.setSize_(Cocoa.NSMakeSize(40, 40))
-                self.icon_cache[icon_path] = icon
-                return icon
-        except Exception as e:
-            print(f"Error loading icon {icon_path}: {e}")
-
-        return None
+        return load_icon(icon_path, ICON_SIZE, ICON_CORNER_RADIUS)
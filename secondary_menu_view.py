@@ -5,10 +5,87 @@ Creates a horizontal menu bar below the pie menu for less frequently used action
 
 import objc
 import Cocoa
+import Quartz
+from icon_helper import ICON_RENDER_SCALE, load_icon
+from view_helper import backing_scale, run_menu_item, set_hover_fill
+
+
+# Button colors
+FILL_COLOR = Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.25, 0.25, 0.25, 0.85).CGColor()
+HOVER_FILL_COLOR = Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.35, 0.35, 0.35, 0.9).CGColor()
+BORDER_COLOR = Cocoa.NSColor.colorWithCalibratedWhite_alpha_(0.9, 0.5).CGColor()
+
+# Button titles: 10 pt white, centered, wrapping
+_title_paragraph_style = Cocoa.NSMutableParagraphStyle.alloc().init()
+_title_paragraph_style.setAlignment_(Cocoa.NSTextAlignmentCenter)
+_title_paragraph_style.setLineBreakMode_(Cocoa.NSLineBreakByWordWrapping)
+TITLE_ATTRIBUTES = {
+    Cocoa.NSFontAttributeName: Cocoa.NSFont.systemFontOfSize_(10),
+    Cocoa.NSForegroundColorAttributeName: Cocoa.NSColor.whiteColor(),
+    Cocoa.NSParagraphStyleAttributeName: _title_paragraph_style
+}
+
+# Icon size in points, and the corner radius baked into each icon
+ICON_SIZE = 30
+ICON_CORNER_RADIUS = 4
+
+
+def build_icon_atlas(icon_paths):
+    """
+    Pack prerendered icons (rounded corners baked in) into a single image,
+    one ICON_SIZE cell per icon in a row, so every icon layer shows a cell
+    of one shared bitmap.
+
+    Args:
+        icon_paths: Icon file paths (duplicates share a cell)
+
+    Returns:
+        Tuple of the atlas NSImage (None if no icon loaded) and a dictionary
+        of icon path to the NSRect of its cell
+    """
+    icons = [(path, load_icon(path, ICON_SIZE, ICON_CORNER_RADIUS)) for path in dict.fromkeys(icon_paths)]
+    icons = [(path, icon) for path, icon in icons if icon]
+    if not icons:
+        return None, {}
+
+    pixels = int(round(ICON_SIZE * ICON_RENDER_SCALE))
+    bitmap = Cocoa.NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
+        None, pixels * len(icons), pixels, 8, 4, True, False, Cocoa.NSDeviceRGBColorSpace, 0, 0
+    )
+    atlas_size = Cocoa.NSMakeSize(ICON_SIZE * len(icons), ICON_SIZE)
+    bitmap.setSize_(atlas_size)
+
+    icon_rects = {}
+    Cocoa.NSGraphicsContext.saveGraphicsState()
+    Cocoa.NSGraphicsContext.setCurrentContext_(
+        Cocoa.NSGraphicsContext.graphicsContextWithBitmapImageRep_(bitmap)
+    )
+    for cell, (path, icon) in enumerate(icons):
+        cell_rect = Cocoa.NSMakeRect(cell * ICON_SIZE, 0, ICON_SIZE, ICON_SIZE)
+        icon.drawInRect_fromRect_operation_fraction_(
+            cell_rect,
+            Cocoa.NSZeroRect,
+            Cocoa.NSCompositeCopy,
+            1.0
+        )
+        icon_rects[path] = cell_rect
+    Cocoa.NSGraphicsContext.restoreGraphicsState()
+
+    atlas = Cocoa.NSImage.alloc().initWithSize_(atlas_size)
+    atlas.addRepresentation_(bitmap)
+    return atlas, icon_rects
 
 
 class SecondaryMenuView(Cocoa.NSView):
-    """Custom view that draws a horizontal menu bar with clickable buttons."""
+    """Custom layer-backed view showing a grid of clickable buttons."""
+
+    # === ADJUSTABLE PARAMETERS (layout and hit testing both use these) ===
+    BUTTON_SPACING = 8              # Space between buttons (horizontal and vertical)
+    VERTICAL_BUTTON_PADDING = 6     # Padding inside button (top and bottom)
+    ICON_TEXT_SPACING = 3           # Space between icon and text
+    TEXT_HEIGHT = 12                # Approximate text height
+    MAX_COLUMNS = 3                 # Grid columns
+    # =====================================================================
 
     def initWithFrame_(self, frame):
         """Initialize the secondary menu view."""
@@ -18,196 +95,240 @@ class SecondaryMenuView(Cocoa.NSView):
 
         self.menu_items = []
         self.hovered_index = -1
-        self.tracking_area = None
-        self.icon_cache = {}  # Cache loaded icons
+        self.tracking_areas = []  # One enter/exit tracking area per button
+        self.icon_atlas = None  # Every item's icon in one image, built with the items
+        self.icon_rects = {}  # Icon path -> its cell in icon_atlas
+        self.title_strings = []  # Attributed titles, by menu item index
+        self.button_layers = []  # Button shape layers, by menu item index
+        self.button_rects = []  # Button frames, by menu item index
+        self.num_columns = 0
+        self.num_rows = 0
+        self.grid_origin = Cocoa.NSZeroPoint  # Bottom-left corner of the grid
+        self.button_size = Cocoa.NSZeroSize
+        self.layer_scale = 1.0  # Backing scale the layers were built for
+
+        self.setWantsLayer_(True)
+        # Everything is drawn by sublayers, so AppKit never needs to redraw
+        # the view's own layer
+        self.setLayerContentsRedrawPolicy_(Cocoa.NSViewLayerContentsRedrawNever)
 
         return self
 
     def updateTrackingAreas(self):
-        """Set up mouse tracking for hover effects."""
+        """
+        Set up mouse tracking for hover effects: one area per button, so
+        AppKit only reports crossing a button's edge, not every mouse move.
+        """
         objc.super(SecondaryMenuView, self).updateTrackingAreas()
 
-        if self.tracking_area:
-            self.removeTrackingArea_(self.tracking_area)
+        for tracking_area in self.tracking_areas:
+            self.removeTrackingArea_(tracking_area)
+        self.tracking_areas = []
 
         tracking_options = (
             Cocoa.NSTrackingMouseEnteredAndExited |
-            Cocoa.NSTrackingMouseMoved |
-            Cocoa.NSTrackingActiveAlways |
-            Cocoa.NSTrackingInVisibleRect
+            Cocoa.NSTrackingActiveAlways
         )
 
-        self.tracking_area = Cocoa.NSTrackingArea.alloc().initWithRect_options_owner_userInfo_(
-            self.bounds(),
-            tracking_options,
-            self,
-            None
-        )
-        self.addTrackingArea_(self.tracking_area)
+        for index, button_rect in enumerate(self.button_rects):
+            tracking_area = Cocoa.NSTrackingArea.alloc().initWithRect_options_owner_userInfo_(
+                button_rect,
+                tracking_options,
+                self,
+                {'index': index}
+            )
+            self.addTrackingArea_(tracking_area)
+            self.tracking_areas.append(tracking_area)
 
     def resetCursorRects(self):
-        """Set up cursor rectangles for the entire view."""
+        """Show the pointing hand over buttons; AppKit uses the arrow elsewhere."""
         objc.super(SecondaryMenuView, self).resetCursorRects()
-        self.addCursorRect_cursor_(self.bounds(), Cocoa.NSCursor.pointingHandCursor())
+        cursor = Cocoa.NSCursor.pointingHandCursor()
+        for button_rect in self.button_rects:
+            self.addCursorRect_cursor_(button_rect, cursor)
 
     def setMenuItems_(self, items):
         """
         Set the menu items to display.
 
         Args:
-            items: List of dictionaries with 'title', 'action', and 'target'
+            items: List of MenuItem tuples (see menu_ui)
         """
         self.menu_items = items
-        self.setNeedsDisplay_(True)
+        self.icon_atlas, self.icon_rects = build_icon_atlas(item.icon for item in items if item.icon)
+        self.title_strings = [
+            Cocoa.NSAttributedString.alloc().initWithString_attributes_(item.title, TITLE_ATTRIBUTES)
+            for item in items
+        ]
+        self.buildButtonLayers()
+
+    def setFrameSize_(self, size):
+        """Lay the buttons out again when the view is resized."""
+        current = self.frame().size
+        if size.width == current.width and size.height == current.height:
+            return
+        objc.super(SecondaryMenuView, self).setFrameSize_(size)
 
-    def drawRect_(self, rect):
-        """
-        Draw the secondary menu as a grid with max 3 columns.
+        # Nothing to lay out until the items arrive (or while still initializing)
+        if getattr(self, 'menu_items', None):
+            self.buildButtonLayers()
 
-        Args:
-            rect: The rectangle to draw in
+    def layoutButtons(self):
+        """
+        Compute every button's frame from the class parameters and current
+        bounds. The layers and hit testing both use this one layout.
         """
-        if not self.menu_items:
-            return
-
         bounds = self.bounds()
         num_items = len(self.menu_items)
-
+        self.button_rects = []
         if num_items == 0:
             return
 
-        # === ADJUSTABLE PARAMETERS ===
-        button_spacing = 8              # Space between buttons (horizontal and vertical)
-        vertical_button_padding = 6    # Padding inside button (top and bottom)
-        icon_text_spacing = 3           # Space between icon and text
-        icon_size = 30                  # Icon size
-        text_height = 12                # Approximate text height
-        # ============================
-
         # Grid layout: max 3 columns
-        max_columns = 3
-        num_columns = min(num_items, max_columns)
+        num_columns = min(num_items, self.MAX_COLUMNS)
         num_rows = (num_items + num_columns - 1) // num_columns  # Ceiling division
 
         # Calculate button height based on content
-        button_height = (vertical_button_padding * 2) + icon_size + icon_text_spacing + text_height
-
-        # Calculate total grid dimensions
-        total_grid_width = (num_columns * bounds.size.width / max_columns) + ((num_columns - 1) * button_spacing)
-        total_grid_height = (num_rows * button_height) + ((num_rows - 1) * button_spacing)
+        button_height = (
+            (self.VERTICAL_BUTTON_PADDING * 2) + ICON_SIZE + self.ICON_TEXT_SPACING + self.TEXT_HEIGHT
+        )
 
         # Calculate button width to fit evenly
-        button_width = (bounds.size.width - (button_spacing * (num_columns + 1))) / num_columns
+        button_width = (bounds.size.width - (self.BUTTON_SPACING * (num_columns + 1))) / num_columns
 
         # Center the grid vertically and horizontally
-        start_x = (bounds.size.width - (num_columns * button_width + (num_columns - 1) * button_spacing)) / 2
+        total_grid_height = (num_rows * button_height) + ((num_rows - 1) * self.BUTTON_SPACING)
+        start_x = (bounds.size.width - (num_columns * button_width + (num_columns - 1) * self.BUTTON_SPACING)) / 2
         start_y = (bounds.size.height - total_grid_height) / 2
 
-        # Draw each button (reversed rows so top of array = top row)
-        for i, item in enumerate(self.menu_items):
-            row = (num_rows - 1) - (i // num_columns)
-            col = i % num_columns
-
-            x_offset = start_x + col * (button_width + button_spacing)
-            y_offset = start_y + row * (button_height + button_spacing)
-
-            button_rect = Cocoa.NSMakeRect(
-                x_offset,
-                y_offset,
+        # Kept for the constant-time hit test
+        self.num_columns = num_columns
+        self.num_rows = num_rows
+        self.grid_origin = Cocoa.NSMakePoint(start_x, start_y)
+        self.button_size = Cocoa.NSMakeSize(button_width, button_height)
+
+        # Reversed rows so top of array = top row
+        for index in range(num_items):
+            row = (num_rows - 1) - (index // num_columns)
+            col = index % num_columns
+            self.button_rects.append(Cocoa.NSMakeRect(
+                start_x + col * (button_width + self.BUTTON_SPACING),
+                start_y + row * (button_height + self.BUTTON_SPACING),
                 button_width,
                 button_height
-            )
+            ))
 
-            # Create rounded rectangle path
-            path = Cocoa.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-                button_rect,
-                5,
-                5
-            )
+    def buildButtonLayers(self):
+        """
+        Build one layer tree per button: a rounded shape layer for the chrome
+        with an icon layer and a text layer on top. Icon layers all show the
+        icon atlas, each cropped to its own cell. Hovering then only swaps a
+        shape layer's fill color, so the view never has to redraw.
+        """
+        for layer in self.button_layers:
+            layer.removeFromSuperlayer()
+        self.button_layers = []
+        self.layer_scale = self.backingScale()
 
-            # Fill color - highlight if hovered
-            if i == self.hovered_index:
-                Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.35, 0.35, 0.35, 0.9).setFill()
-            else:
-                Cocoa.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.25, 0.25, 0.25, 0.85).setFill()
-
-            path.fill()
-
-            # Draw border
-            Cocoa.NSColor.colorWithCalibratedWhite_alpha_(0.9, 0.5).setStroke()
-            path.setLineWidth_(1.0)
-            path.stroke()
-
-            # Draw icon if available
-            if 'icon' in item and item['icon']:
-                icon = self.loadIcon_(item['icon'])
-                if icon:
-                    icon_x = x_offset + (button_width - icon_size) / 2
-                    icon_y = y_offset + vertical_button_padding + text_height + icon_text_spacing
-                    icon_rect = Cocoa.NSMakeRect(
-                        icon_x,
-                        icon_y,
-                        icon_size,
-                        icon_size
-                    )
-
-                    # Save graphics state
-                    Cocoa.NSGraphicsContext.currentContext().saveGraphicsState()
-
-                    # Create rounded rectangle clipping path for icon
-                    icon_corner_radius = 4
-                    icon_clip_path = Cocoa.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-                        icon_rect,
-                        icon_corner_radius,
-                        icon_corner_radius
-                    )
-                    icon_clip_path.addClip()
-
-                    # Draw the icon
-                    icon.drawInRect_fromRect_operation_fraction_(
-                        icon_rect,
-                        Cocoa.NSZeroRect,
-                        Cocoa.NSCompositeSourceOver,
-                        1.0
-                    )
-
-                    # Restore graphics state
-                    Cocoa.NSGraphicsContext.currentContext().restoreGraphicsState()
-
-            # Draw text label with word wrapping
-            paragraph_style = Cocoa.NSMutableParagraphStyle.alloc().init()
-            paragraph_style.setAlignment_(Cocoa.NSTextAlignmentCenter)
-            paragraph_style.setLineBreakMode_(Cocoa.NSLineBreakByWordWrapping)
-
-            attributes = {
-                Cocoa.NSFontAttributeName: Cocoa.NSFont.systemFontOfSize_(10),
-                Cocoa.NSForegroundColorAttributeName: Cocoa.NSColor.whiteColor(),
-                Cocoa.NSParagraphStyleAttributeName: paragraph_style
-            }
-
-            title = Cocoa.NSString.stringWithString_(item['title'])
-            text_max_width = button_width - 8
-            text_rect = Cocoa.NSMakeRect(
-                x_offset + 4,
-                y_offset + vertical_button_padding,
-                text_max_width,
-                text_height
-            )
-            title.drawInRect_withAttributes_(text_rect, attributes)
+        self.layoutButtons()
+
+        # Tracking areas and cursor rects follow the buttons
+        self.updateTrackingAreas()
+        window = self.window()
+        if window:
+            window.invalidateCursorRectsForView_(self)
+
+        num_items = len(self.menu_items)
+        if num_items == 0:
+            return
+
+        vertical_button_padding = self.VERTICAL_BUTTON_PADDING
+        text_height = self.TEXT_HEIGHT
+        button_width = self.button_size.width
+
+        # Every button has the same rounded rect, in its own coordinates
+        button_path = Quartz.CGPathCreateWithRoundedRect(
+            Quartz.CGRectMake(0, 0, button_width, self.button_size.height), 5, 5, None
+        )
+        atlas_width = self.icon_atlas.size().width if self.icon_atlas else 0
+        scale = self.layer_scale
+
+        for item, title_string, button_rect in zip(self.menu_items, self.title_strings, self.button_rects):
+            button_layer = Quartz.CAShapeLayer.layer()
+            button_layer.setFrame_(button_rect)
+            button_layer.setPath_(button_path)
+            button_layer.setFillColor_(FILL_COLOR)
+            button_layer.setStrokeColor_(BORDER_COLOR)
+            button_layer.setLineWidth_(1.0)
+
+            # Icon, cropped from its atlas cell (corners already rounded)
+            atlas_rect = self.icon_rects.get(item.icon) if item.icon else None
+            if atlas_rect:
+                icon_layer = Quartz.CALayer.layer()
+                icon_layer.setFrame_(Quartz.CGRectMake(
+                    (button_width - ICON_SIZE) / 2,
+                    vertical_button_padding + text_height + self.ICON_TEXT_SPACING,
+                    ICON_SIZE,
+                    ICON_SIZE
+                ))
+                icon_layer.setContents_(self.icon_atlas)
+                icon_layer.setContentsRect_(Quartz.CGRectMake(
+                    atlas_rect.origin.x / atlas_width, 0, atlas_rect.size.width / atlas_width, 1
+                ))
+                icon_layer.setContentsScale_(scale)
+                button_layer.addSublayer_(icon_layer)
+
+            # Text label with word wrapping, inset 4 pt each side
+            title_layer = Quartz.CATextLayer.layer()
+            title_layer.setFrame_(Quartz.CGRectMake(4, vertical_button_padding, button_width - 8, text_height))
+            title_layer.setString_(title_string)
+            title_layer.setWrapped_(True)
+            title_layer.setContentsScale_(scale)
+            button_layer.addSublayer_(title_layer)
+
+            self.layer().addSublayer_(button_layer)
+            self.button_layers.append(button_layer)
+
+        if 0 <= self.hovered_index < num_items:
+            self.button_layers[self.hovered_index].setFillColor_(HOVER_FILL_COLOR)
+
+    def backingScale(self):
+        """Return the backing scale factor for crisp text on Retina displays."""
+        return backing_scale(self)
+
+    def viewDidChangeBackingProperties(self):
+        """Rebuild the buttons and icon atlas at the new backing scale."""
+        objc.super(SecondaryMenuView, self).viewDidChangeBackingProperties()
+        if self.backingScale() != self.layer_scale:
+            self.buildButtonLayers()
+
+    def mouseEntered_(self, event):
+        """Highlight the button whose tracking area the pointer entered."""
+        self.setHoveredIndex_(event.trackingArea().userInfo()['index'])
+
+    def mouseExited_(self, event):
+        """Clear the highlight when the pointer leaves the hovered button."""
+        if event.trackingArea().userInfo()['index'] == self.hovered_index:
+            self.setHoveredIndex_(-1)
 
     def mouseMoved_(self, event):
-        """Handle mouse movement for hover effect."""
+        """Handle mouse movement during drags (plain moves are tracked per button)."""
         point = self.convertPoint_fromView_(event.locationInWindow(), None)
-        index = self.getButtonIndexAtPoint_(point)
+
+        # Still inside the hovered button: hover and cursor are already right
+        hovered_index = self.hovered_index
+        if (0 <= hovered_index < len(self.button_rects) and
+                Cocoa.NSPointInRect(point, self.button_rects[hovered_index])):
+            return
+
+        self.updateHoveredIndex_(point)
 
         # Update cursor based on whether we're over a button
-        if index >= 0:
+        if self.hovered_index >= 0:
             Cocoa.NSCursor.pointingHandCursor().set()
         else:
             Cocoa.NSCursor.arrowCursor().set()
 
-        self.updateHoveredIndex_(point)
-
     def mouseDragged_(self, event):
         """Handle left mouse button drag."""
         self.mouseMoved_(event)
@@ -226,32 +347,22 @@ class SecondaryMenuView(Cocoa.NSView):
         index = self.getButtonIndexAtPoint_(point)
 
         if index >= 0 and index < len(self.menu_items):
-            item = self.menu_items[index]
-            target = item['target']
-            action = item['action']
-
-            # Call the action
-            if target and action:
-                try:
-                    # Check if this action needs an app_path parameter
-                    if 'app_path' in item:
-                        target.performSelector_withObject_(action, {'path': item['app_path']})
-                    else:
-                        target.performSelector_withObject_(action, None)
-                except Exception as e:
-                    print(f"Error calling action {action}: {e}")
-
-            # Close the menu by hiding it
-            window = self.window()
-            if window:
-                window.orderOut_(None)
+            run_menu_item(self, self.menu_items[index])
 
     def updateHoveredIndex_(self, point):
         """Update which button is being hovered."""
-        new_index = self.getButtonIndexAtPoint_(point)
+        self.setHoveredIndex_(self.getButtonIndexAtPoint_(point))
+
+    def setHoveredIndex_(self, new_index):
+        """
+        Highlight a button, un-highlighting the previous one.
+
+        Args:
+            new_index: Index of the button to highlight, or -1 for none
+        """
         if new_index != self.hovered_index:
+            set_hover_fill(self.button_layers, self.hovered_index, new_index, FILL_COLOR, HOVER_FILL_COLOR)
             self.hovered_index = new_index
-            self.setNeedsDisplay_(True)
 
     def getButtonIndexAtPoint_(self, point):
         """
@@ -263,75 +374,25 @@ class SecondaryMenuView(Cocoa.NSView):
         Returns:
             Index of the button, or -1 if not in any button
         """
-        bounds = self.bounds()
-        num_items = len(self.menu_items)
-
-        if num_items == 0:
+        if not self.button_rects:
             return -1
 
-        # === ADJUSTABLE PARAMETERS (must match drawRect_) ===
-        button_spacing = 8
-        vertical_button_padding = 8
-        icon_text_spacing = 4
-        icon_size = 30
-        text_height = 12
-        # ===================================================
-
-        # Grid layout: max 3 columns
-        max_columns = 3
-        num_columns = min(num_items, max_columns)
-        num_rows = (num_items + num_columns - 1) // num_columns
-
-        # Calculate button height based on content
-        button_height = (vertical_button_padding * 2) + icon_size + icon_text_spacing + text_height
-
-        # Calculate total grid dimensions
-        total_grid_height = (num_rows * button_height) + ((num_rows - 1) * button_spacing)
-
-        # Calculate button width
-        button_width = (bounds.size.width - (button_spacing * (num_columns + 1))) / num_columns
-
-        # Center the grid
-        start_x = (bounds.size.width - (num_columns * button_width + (num_columns - 1) * button_spacing)) / 2
-        start_y = (bounds.size.height - total_grid_height) / 2
-
-        # Check each button position (reversed rows to match rendering)
-        for i in range(num_items):
-            row = (num_rows - 1) - (i // num_columns)
-            col = i % num_columns
-
-            x_offset = start_x + col * (button_width + button_spacing)
-            y_offset = start_y + row * (button_height + button_spacing)
-
-            if (point.x >= x_offset and point.x <= x_offset + button_width and
-                point.y >= y_offset and point.y <= y_offset + button_height):
-                return i
-
-        return -1
-
-    def loadIcon_(self, icon_path):
-        """
-        Load an icon from the specified path and cache it.
+        # Buttons form a uniform grid, so the cell follows directly from x and y
+        button_width = self.button_size.width
+        button_height = self.button_size.height
+        offset_x = point.x - self.grid_origin.x
+        offset_y = point.y - self.grid_origin.y
+        if offset_x < 0 or offset_y < 0:
+            return -1
 
-        Args:
-            icon_path: Path to the icon file (PNG, JPEG, WebP)
+        col = int(offset_x // (button_width + self.BUTTON_SPACING))
+        slot = int(offset_y // (button_height + self.BUTTON_SPACING))
+        if col >= self.num_columns or slot >= self.num_rows:
+            return -1
+        if (offset_x - col * (button_width + self.BUTTON_SPACING) > button_width or
+                offset_y - slot * (button_height + self.BUTTON_SPACING) > button_height):
+            return -1  # In the gap between buttons
 
-        Returns:
-            NSImage object or None if loading fails
-        """
-        # Check cache first
-        if icon_path in self.icon_cache:
-            return self.icon_cache[icon_path]
-
-        # Try to load the icon
-        try:
-            icon = Cocoa.NSImage.alloc().initWithContentsOfFile_(icon_path)
-            if icon:
-                # Resize to 18x18 for secondary menu
-                icon.setSize_(Cocoa.NSMakeSize(18, 18))
-                self.icon_cache[icon_path] = icon
-                return icon
-        except Exception as e:
-            print(f"Error loading icon {icon_path}: {e}")
-
-        return None
+        # Slot 0 is the bottom row, which holds the last items
+        index = (self.num_rows - 1 - slot) * self.num_columns + col
+        return index if index < len(self.menu_items) else -1
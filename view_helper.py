@@ -0,0 +1,61 @@
+"""
+View Helper
+Behavior shared by the layer-backed menu views: hover fills, backing scale
+and running a clicked item.
+"""
+
+import logging
+import Cocoa
+import Quartz
+
+
+log = logging.getLogger("handy.view_helper")
+
+
+def set_hover_fill(layers, old_index, new_index, fill_color, hover_fill_color):
+    """
+    Move the hover fill from one shape layer to another, without the implicit
+    fade animation.
+
+    Args:
+        layers: CAShapeLayers, one per item
+        old_index: Index of the currently hovered layer, or -1 for none
+        new_index: Index of the layer to highlight, or -1 for none
+        fill_color: CGColor for a layer that isn't hovered
+        hover_fill_color: CGColor for the hovered layer
+    """
+    Quartz.CATransaction.begin()
+    Quartz.CATransaction.setDisableActions_(True)
+    if 0 <= old_index < len(layers):
+        layers[old_index].setFillColor_(fill_color)
+    if 0 <= new_index < len(layers):
+        layers[new_index].setFillColor_(hover_fill_color)
+    Quartz.CATransaction.commit()
+
+
+def backing_scale(view):
+    """Return the backing scale factor of a view's window, or of the main screen."""
+    window = view.window()
+    if window:
+        return window.backingScaleFactor()
+    return Cocoa.NSScreen.mainScreen().backingScaleFactor()
+
+
+def run_menu_item(view, item):
+    """
+    Call a clicked item's action and close the menu it was shown in.
+
+    Args:
+        view: The menu view that was clicked
+        item: MenuItem tuple (see menu_ui)
+    """
+    # Call the action through the handler resolved when the items were built
+    try:
+        item.handler(item.argument)
+    except Exception as e:
+        log.error(f"Error calling action {item.action}: {e}")
+
+    # Close the menu by hiding it
+    window = view.window()
+    if window:
+        window.orderOut_(None)